@@ -51,9 +51,11 @@ class CartItemSerializer(serializers.ModelSerializer):
             level_id = attrs.get("level").id
 
         if attrs.get("paper") and attrs.get("deadline"):
-            if not get_service(
+            service = get_service(
                 attrs.get("paper").id, attrs.get("deadline").id, level_id
-            ):
+            )
+
+            if not service:
                 raise serializers.ValidationError(
                     _("Apologies, this service is currently unavailable")
                 )
@@ -63,6 +65,7 @@ class CartItemSerializer(serializers.ModelSerializer):
                 attrs["deadline"].id,
                 attrs["writer_type"].id,
                 level_id,
+                service=service,
             ):
 
                 raise serializers.ValidationError(
@@ -103,7 +106,7 @@ class CartItemSerializer(serializers.ModelSerializer):
 
         if writer_type:
             writer_type_service = get_writer_type_service(
-                paper.id, deadline.id, writer_type.id, level_id
+                paper.id, deadline.id, writer_type.id, level_id, service=service
             )
 
             if not writer_type_service:
@@ -221,7 +224,7 @@ class CartSerializer(serializers.ModelSerializer):
 
             if writer_type:
                 writer_type_service = get_writer_type_service(
-                    paper.id, deadline.id, writer_type.id, level_id
+                    paper.id, deadline.id, writer_type.id, level_id, service=service
                 )
                 defaults.update({"writer_type_price": writer_type_service.amount})
 
@@ -306,20 +309,17 @@ class AttachmentSerializer(serializers.ModelSerializer):
 
 
 class DownloadAttachmentSerializer(serializers.Serializer):
-    attachment = serializers.UUIDField()
-    item = serializers.UUIDField()
+    """Download cart item attachment serializer
 
-    def validate_attachment(self, attachment_id):
-        return check_model_or_throw_validation_error(Attachment, attachment_id, "id")
+    Expects the item in the context, with its attachments prefetched
+    """
 
-    def validate_item(self, item_id):
-        return check_model_or_throw_validation_error(Item, item_id, "id")
-
-    def validate(self, attrs):
-        attachment = Attachment.objects.get(pk=attrs["attachment"])
-        item = Item.objects.get(pk=attrs["item"])
+    attachment = serializers.UUIDField()
 
-        if attachment.cart_item != item:
-            raise serializers.ValidationError(_("Attachment does not belong to item"))
+    def validate_attachment(self, attachment_id):
+        """Return the attachment if it belongs to the item"""
+        for attachment in self.context["item"].attachments.all():
+            if attachment.id == attachment_id:
+                return attachment
 
-        return super().validate(attrs)
+        raise serializers.ValidationError(_("Attachment does not belong to item"))
@@ -0,0 +1,65 @@
+"""Serializers"""
+
+import pytest
+
+from apps.catalog.models import Course, Deadline, Format, Paper
+
+from ..models import Attachment, Cart, Item
+from ..serializers import DownloadAttachmentSerializer
+
+
+@pytest.fixture
+def item(use_tenant_connection, customer):
+    """Cart item with an attachment"""
+    item = Item.objects.create(
+        cart=Cart.objects.create(owner=customer),
+        topic="This is a topic",
+        course=Course.objects.create(name="TestCourse"),
+        paper=Paper.objects.create(name="TestPaper"),
+        paper_format=Format.objects.create(name="TestFormat"),
+        deadline=Deadline.objects.create(
+            value=1, deadline_type=Deadline.DeadlineType.DAY
+        ),
+        page_price=15,
+    )
+    Attachment.objects.create(cart_item=item, attachment="test.doc")
+
+    return item
+
+
+@pytest.mark.django_db
+class TestDownloadAttachmentSerializer:
+    """Tests for DownloadAttachmentSerializer"""
+
+    def test_prefetched_attachment(self, item, django_assert_num_queries):
+        """The attachment is validated against the prefetched attachments"""
+        attachment = item.attachments.get()
+        item = Item.objects.prefetch_related("attachments").get(pk=item.pk)
+        serializer = DownloadAttachmentSerializer(
+            data={"attachment": str(attachment.pk)}, context={"item": item}
+        )
+
+        with django_assert_num_queries(0):
+            assert serializer.is_valid()
+
+        assert serializer.validated_data["attachment"] == attachment
+
+    def test_attachment_of_other_item(self, item):
+        """An attachment of another item is invalid"""
+        other_item = Item.objects.create(
+            cart=item.cart,
+            topic="This is another topic",
+            course=item.course,
+            paper=item.paper,
+            paper_format=item.paper_format,
+            deadline=item.deadline,
+            page_price=15,
+        )
+        attachment = Attachment.objects.create(
+            cart_item=other_item, attachment="other.doc"
+        )
+        serializer = DownloadAttachmentSerializer(
+            data={"attachment": str(attachment.pk)}, context={"item": item}
+        )
+        assert not serializer.is_valid()
+        assert "attachment" in serializer.errors
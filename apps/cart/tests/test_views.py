@@ -1131,6 +1131,35 @@ class RemoveSingleCartItemTestCase(FastTenantTestCase):
         response = self.post({"item": ""})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_item_in_other_cart(self):
+        """An item in another user's cart is not removed"""
+        owner = User.objects.create_user(
+            username="other_owner",
+            first_name="Test",
+            email="other_owner@example.com",
+            password="12345",
+            is_email_verified=True,
+        )
+        cart, _ = Cart.objects.get_or_create(owner=owner)
+        item = Item.objects.create(
+            cart=cart,
+            topic="This is a topic",
+            level=self.level,
+            course=self.course,
+            paper=self.paper,
+            paper_format=self.paper_format,
+            deadline=self.deadline,
+            language=Item.Language.ENGLISH_UK,
+            pages=3,
+            references=1,
+            quantity=2,
+            page_price=15,
+        )
+        response = self.post({"item": item.id})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(Item.objects.filter(pk=item.pk).exists())
+        self.assertEqual(self.cart.items.count(), 2)
+
     @mock.patch("apps.cart.views.is_coupon_valid")
     def test_invalid_coupon_removed(self, is_valid_mock):
         """If applied coupon becomes invalid when we remove an item, we remove it"""
@@ -1169,6 +1198,37 @@ class RemoveSingleCartItemTestCase(FastTenantTestCase):
         cart.refresh_from_db()
         self.assertIsNone(cart.coupon)
 
+    def test_coupon_below_minimum_removed(self):
+        """Coupon is removed if the subtotal drops below its minimum"""
+        coupon = Coupon.objects.create(
+            code="COUP5",
+            percent_off=5,
+            minimum=150,
+            start_date=timezone.now(),
+            end_date=timezone.now() + timedelta(days=1),
+        )
+        Cart.objects.filter(pk=self.cart.pk).update(coupon=coupon)
+        response = self.post(self.valid_payload)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["coupon"])
+        self.cart.refresh_from_db()
+        self.assertIsNone(self.cart.coupon)
+
+    def test_coupon_above_minimum_kept(self):
+        """Coupon is kept if the subtotal still meets its minimum"""
+        coupon = Coupon.objects.create(
+            code="COUP5",
+            percent_off=5,
+            minimum=90,
+            start_date=timezone.now(),
+            end_date=timezone.now() + timedelta(days=1),
+        )
+        Cart.objects.filter(pk=self.cart.pk).update(coupon=coupon)
+        response = self.post(self.valid_payload)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.cart.refresh_from_db()
+        self.assertEqual(self.cart.coupon, coupon)
+
 
 class ClearCartTestCase(FastTenantTestCase):
     """Tests for clearing cart"""
@@ -1286,8 +1346,13 @@ class ClearCartTestCase(FastTenantTestCase):
         self.assertIsNotNone(cart.coupon)
         response = self.get(owner)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["coupon"])
+        self.assertEqual(response.data["items"], [])
         cart.refresh_from_db()
         self.assertIsNone(cart.coupon)
+        self.assertFalse(Item.objects.filter(cart=cart).exists())
+        # Other carts are left untouched
+        self.assertEqual(self.cart.items.count(), 1)
 
 
 class GetSingleCartItemTestCase(FastTenantTestCase):
@@ -2092,7 +2157,7 @@ class DeleteAttachmentTestCase(FastTenantTestCase):
         self.assertEqual(Attachment.objects.count(), 0)
 
 
-@mock.patch("apps.cart.views.create_presigned_url")
+@mock.patch("apps.cart.views.get_cached_presigned_url")
 class DownloadAttachmentTestCase(FastTenantTestCase):
     """Tests for downloading an attachment"""
 
@@ -1,11 +1,14 @@
 """serializers"""
 
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Prefetch
+from django.http import Http404
 from rest_framework import mixins, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from apps.common.utils import create_presigned_url
+from apps.common.utils import get_cached_presigned_url
 from apps.coupon.utils import is_coupon_valid
 
 from .models import Attachment, Cart, Item
@@ -40,12 +43,34 @@ class CartViewSet(mixins.CreateModelMixin, mixins.ListModelMixin, BaseGenericVie
         if not cart:
             return Response({"cart": None})
 
-        serializer = CartSerializer(self.get_queryset().first())
+        serializer = CartSerializer(cart)
         return Response({"cart": serializer.data})
 
     def get_queryset(self):
         """Override queryset to return only cart object owned by user"""
-        return Cart.objects.filter(owner=self.request.user)
+        queryset = Cart.objects.filter(owner=self.request.user).select_related(
+            "owner", "coupon"
+        )
+
+        # Actions that modify the items re-read them before serializing, only
+        # the read-only list can safely use prefetched items
+        if self.action == "list":
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "items",
+                    queryset=Item.objects.select_related(
+                        "level",
+                        "course",
+                        "paper",
+                        "paper_format",
+                        "deadline",
+                        "writer_type",
+                    ),
+                ),
+                "items__attachments",
+            )
+
+        return queryset
 
     def get_serializer_class(self):
         """Get serializer class that matches current action"""
@@ -66,15 +91,21 @@ class CartViewSet(mixins.CreateModelMixin, mixins.ListModelMixin, BaseGenericVie
         serializer_class = self.get_serializer_class()
         serializer = serializer_class(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
-        item = cart.items.get(pk=serializer.data["item"])
-        item.delete()
 
-        # re-evaluate coupon validity. If valid keep coupon, else
-        # remove coupon. Coupon can e.g become valid if cart subtotal
-        # does not meet the minimum amount required for coupon
-        if cart.coupon and not is_coupon_valid(cart.coupon, cart.owner):
-            cart.coupon = None
-            cart.save()
+        with transaction.atomic():
+            deleted, _ = cart.items.filter(pk=serializer.data["item"]).delete()
+
+            if not deleted:
+                raise Http404
+
+            # re-evaluate coupon validity. If valid keep coupon, else
+            # remove coupon. Coupon can e.g become valid if cart subtotal
+            # does not meet the minimum amount required for coupon
+            if cart.coupon and not is_coupon_valid(
+                cart.coupon, cart.subtotal, user=cart.owner
+            ):
+                Cart.objects.filter(pk=cart.pk).update(coupon=None)
+                cart.coupon = None
 
         return Response(CartSerializer(cart).data, status=status.HTTP_200_OK)
 
@@ -87,9 +118,14 @@ class CartViewSet(mixins.CreateModelMixin, mixins.ListModelMixin, BaseGenericVie
     def clear(self, request, *args, **kwargs):
         """Clear cart action"""
         cart = self.get_object()
-        cart.items.all().delete()
+
+        # Deleting through the queryset keeps the post_delete signal on
+        # attachments firing so that their files are removed from storage
+        with transaction.atomic():
+            Item.objects.filter(cart=cart).delete()
+            Cart.objects.filter(pk=cart.pk).update(coupon=None)
+
         cart.coupon = None
-        cart.save()
         return Response(CartSerializer(cart).data, status=status.HTTP_200_OK)
 
 
@@ -103,7 +139,9 @@ class CartItemViewset(
 
     def get_queryset(self):
         """Override queryset to return only cart object owned by user"""
-        return Item.objects.filter(cart__owner=self.request.user)
+        return Item.objects.filter(cart__owner=self.request.user).prefetch_related(
+            "attachments"
+        )
 
     def get_serializer_class(self):
         """Get serializer class that matches current action"""
@@ -123,11 +161,12 @@ class CartItemViewset(
         """Download cart item attachment"""
         item = self.get_object()
         serializer_class = self.get_serializer_class()
-        request.data.update({"item": item.id})
-        serializer = serializer_class(data=request.data, context={"request": request})
+        serializer = serializer_class(
+            data=request.data, context={"request": request, "item": item}
+        )
         serializer.is_valid(raise_exception=True)
-        attachment = Attachment.objects.get(pk=serializer.data["attachment"])
-        url = create_presigned_url(
+        attachment = serializer.validated_data["attachment"]
+        url = get_cached_presigned_url(
             settings.AWS_STORAGE_BUCKET_NAME,
             f"media/{request.tenant.schema_name}/{attachment.attachment.name}",
         )
@@ -12,8 +12,8 @@ class LevelFilter(django_filters.FilterSet):
     def paper_filter(self, queryset, _, value):
         """Return academic levels where paper query param matches value"""
         level_ids = (
-            Service.objects.filter(paper__id=value)
-            .values_list("level__id", flat=True)
+            Service.objects.filter(paper_id=value)
+            .values_list("level_id", flat=True)
             .distinct()
         )
 
@@ -33,8 +33,8 @@ class DeadlineFilter(django_filters.FilterSet):
     def paper_filter(self, queryset, _, value):
         """Return distinct deadlines where paper query param matches value"""
         deadline_ids = (
-            Service.objects.filter(paper__id=value)
-            .values_list("deadline__id", flat=True)
+            Service.objects.filter(paper_id=value)
+            .values_list("deadline_id", flat=True)
             .distinct()
         )
 
@@ -43,8 +43,8 @@ class DeadlineFilter(django_filters.FilterSet):
     def level_filter(self, queryset, _, value):
         """Return distinct deadlines where level query param matches value"""
         deadline_ids = (
-            Service.objects.filter(level__id=value)
-            .values_list("deadline__id", flat=True)
+            Service.objects.filter(level_id=value)
+            .values_list("deadline_id", flat=True)
             .distinct()
         )
 
@@ -62,9 +62,7 @@ class PaperFilter(django_filters.FilterSet):
 
     def service_only_filter(self, queryset, _, value):
         if value:
-            paper_ids = (
-                Service.objects.all().values_list("paper__id", flat=True).distinct()
-            )
+            paper_ids = Service.objects.values_list("paper_id", flat=True).distinct()
 
             return queryset.filter(id__in=paper_ids)
 
@@ -0,0 +1,17 @@
+# Generated by Django 4.0 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0006_alter_writertypeservice_amount'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['paper', 'level', 'deadline'], name='service_paper_level_dl_idx'),
+        ),
+    ]
@@ -3,6 +3,7 @@ from datetime import timedelta
 
 from django.db import models
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from apps.common.models import AbstractBase
@@ -75,7 +76,12 @@ class Deadline(AbstractBase):
     def __str__(self):
         return self.full_name
 
-    @property
+    def save(self, *args, **kwargs):
+        # value or deadline_type may have changed, drop the cached full_name
+        self.__dict__.pop("full_name", None)
+        super().save(*args, **kwargs)
+
+    @cached_property
     def full_name(self):
         """Returns full name by combining the value and type"""
         suffix = ""
@@ -140,6 +146,12 @@ class Service(AbstractBase):
 
     class Meta(AbstractBase.Meta):
         unique_together = ("level", "deadline", "paper")
+        indexes = [
+            models.Index(
+                fields=["paper", "level", "deadline"],
+                name="service_paper_level_dl_idx",
+            ),
+        ]
 
     level = models.ForeignKey(
         Level,
@@ -175,6 +187,9 @@ class Service(AbstractBase):
 class WriterTypeTag(AbstractBase):
     title = models.CharField(max_length=20)
 
+    def __str__(self):
+        return self.title
+
 
 class WriterType(AbstractBase):
     """type of writer information"""
@@ -1,4 +1,7 @@
 """serializers"""
+from collections import defaultdict
+
+from django.db import transaction
 from rest_framework import serializers
 
 from apps.common.utils import check_model_or_throw_validation_error
@@ -13,7 +16,7 @@ from .models import (
     WriterType,
     WriterTypeService,
 )
-from .utils import get_service, get_writer_type_service
+from .utils import get_service, get_service_and_writer_type_service
 
 
 class LevelSerializer(serializers.ModelSerializer):
@@ -140,23 +143,53 @@ class PaperSerializer(serializers.ModelSerializer):
             "deadlines",
         )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # whether a paper has levels, recorded by get_levels for get_deadlines
+        self._paper_has_levels = {}
+
     def get_levels(self, obj):
         """Get academic levels for paper
 
         For each academic level return the deadlines that match paper
         """
-        levels = Level.objects.filter(services__paper=obj).distinct()
+        levels = list(
+            Level.objects.filter(services__paper=obj)
+            .only("id", "name", "sort_order")
+            .distinct()
+        )
+        self._paper_has_levels[obj.id] = bool(levels)
+
+        if not levels:
+            return []
+
+        deadlines = list(
+            Deadline.objects.filter(services__paper=obj, services__level__isnull=False)
+            .only("id", "value", "deadline_type", "sort_order")
+            .distinct()
+        )
+        level_deadline_ids = defaultdict(set)
+
+        for level_id, deadline_id in Service.objects.filter(
+            paper=obj, level__isnull=False
+        ).values_list("level_id", "deadline_id"):
+            level_deadline_ids[level_id].add(deadline_id)
+
+        # serialize each level and deadline once, then stitch the deadlines
+        # into their levels
+        serialized_deadlines = list(
+            zip(deadlines, DeadlineInlineSerializer(deadlines, many=True).data)
+        )
         output = []
 
-        # for each level get the deadlines
-        for level in levels:
-            deadlines = Deadline.objects.filter(
-                services__paper=obj, services__level=level
-            ).distinct()
-            serialized_level = LevelInlineSerializer(level).data
-            serialized_level["deadlines"] = DeadlineInlineSerializer(
-                deadlines, many=True
-            ).data
+        for level, serialized_level in zip(
+            levels, LevelInlineSerializer(levels, many=True).data
+        ):
+            serialized_level["deadlines"] = [
+                serialized_deadline
+                for deadline, serialized_deadline in serialized_deadlines
+                if deadline.id in level_deadline_ids[level.id]
+            ]
             output.append(serialized_level)
 
         return output
@@ -168,10 +201,19 @@ class PaperSerializer(serializers.ModelSerializer):
         deadlines that should be referenced are the ones that associated
         with a level
         """
-        if Level.objects.filter(services__paper=obj).exists():
+        has_levels = self._paper_has_levels.get(obj.id)
+
+        if has_levels is None:
+            has_levels = Level.objects.filter(services__paper=obj).exists()
+
+        if has_levels:
             return []
 
-        deadlines = Deadline.objects.filter(services__paper=obj).distinct()
+        deadlines = (
+            Deadline.objects.filter(services__paper=obj)
+            .only("id", "value", "deadline_type", "sort_order")
+            .distinct()
+        )
         return DeadlineInlineSerializer(deadlines, many=True).data
 
 
@@ -210,17 +252,26 @@ class CalculatorSerializer(serializers.Serializer):
         return check_model_or_throw_validation_error(WriterType, writer_type_id, "id")
 
     def validate(self, attrs):
-        if not get_service(attrs["paper"], attrs["deadline"], attrs.get("level")):
-            raise serializers.ValidationError("Invalid service", code="invalid_service")
+        writer_type_service = None
+
+        if attrs.get("writer_type"):
+            service, writer_type_service = get_service_and_writer_type_service(
+                attrs["paper"],
+                attrs["deadline"],
+                attrs["writer_type"],
+                attrs.get("level"),
+            )
 
-        if attrs.get("writer_type") and not get_writer_type_service(
-            attrs["paper"],
-            attrs["deadline"],
-            attrs["writer_type"],
-            attrs.get("level"),
-        ):
+        else:
+            service = get_service(attrs["paper"], attrs["deadline"], attrs.get("level"))
+
+        if not service:
             raise serializers.ValidationError("Invalid service", code="invalid_service")
 
+        # keep the resolved services so that the view does not query them again
+        self.context["service"] = service
+        self.context["writer_type_service"] = writer_type_service
+
         return super().validate(attrs)
 
 
@@ -248,13 +299,8 @@ class WriterTypeInlineSerializer(serializers.ModelSerializer):
         )
 
 
-class WriterTypeTagListField(serializers.RelatedField):
-    def to_representation(self, value):
-        return value.title
-
-
 class WriterTypeListInlineSerializer(serializers.ModelSerializer):
-    tags = WriterTypeTagListField(many=True, read_only=True)
+    tags = serializers.StringRelatedField(many=True)
 
     class Meta:
         model = WriterType
@@ -276,6 +322,13 @@ class WriterTypeServiceListSerializer(serializers.ModelSerializer):
             "amount",
         )
 
+    @classmethod
+    def prefetch_queryset(cls, queryset):
+        """Load the nested writer types and their tags in batch"""
+        return queryset.select_related("writer_type").prefetch_related(
+            "writer_type__tags"
+        )
+
 
 class WriterTypeServiceSerializer(serializers.Serializer):
     level = serializers.UUIDField(required=False)
@@ -339,6 +392,7 @@ class CreatePricesSerializer(serializers.Serializer):
 
         return paper_id
 
+    @transaction.atomic
     def save(self, **kwargs):
         prices = self.validated_data.pop("prices")
         paper = Paper.objects.get(id=self.validated_data["paper_id"])
@@ -0,0 +1,24 @@
+"""signals"""
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.catalog.models import Service
+from apps.catalog.utils import get_services_cache_key
+
+# pylint: disable=unused-argument
+
+
+@receiver(post_save, sender=Service)
+@receiver(post_delete, sender=Service)
+def clear_services_cache(sender, instance, **kwargs):
+    """Drop the cached services of the paper and deadline of a service
+
+    The cache is cleared once the transaction is committed, a lookup made
+    before the commit still reads the previous services and would cache them.
+    `bulk_create` and `QuerySet.update` do not send these signals, clear the
+    cache key explicitly when changing services with either of them
+    """
+    cache_key = get_services_cache_key(instance.paper_id, instance.deadline_id)
+    transaction.on_commit(lambda: cache.delete(cache_key))
@@ -1,11 +1,11 @@
 """Models"""
 
-from datetime import timedelta
+from datetime import datetime, timedelta
+from unittest import mock
 
-from django.db import transaction
+import pytest
 from django.db.utils import DataError, IntegrityError
 from django.utils import timezone
-from django_tenants.test.cases import FastTenantTestCase
 
 from ..models import (
     Course,
@@ -18,235 +18,190 @@ from ..models import (
     WriterTypeService,
 )
 
+DAY = Deadline.DeadlineType.DAY
+HOUR = Deadline.DeadlineType.HOUR
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+UNIQUE_VIOLATION = "duplicate key value violates unique constraint"
 
-class LevelTestCase(FastTenantTestCase):
-    """
-    Tests for model Level
-    """
 
-    def setUp(self):
-        self.level = Level.objects.create(name="TestLevel")
+@pytest.fixture
+def service(use_tenant_connection):
+    """Service together with the level, deadline and paper it uses"""
+    return Service.objects.create(
+        level=Level.objects.create(name="TestLevel"),
+        deadline=Deadline.objects.create(value=1, deadline_type=DAY),
+        paper=Paper.objects.create(name="TestPaper"),
+        amount=10.00,
+    )
 
-    def test_level_creation(self):
-        """Ensure we can create a level object."""
-        self.assertTrue(isinstance(self.level, Level))
-        self.assertEqual(self.level.__str__(), self.level.name)
 
+@pytest.fixture
+def writer_type(use_tenant_connection):
+    return WriterType.objects.create(
+        name="Test",
+        sort_order=1,
+        description="Awesome description here",
+    )
 
-class CourseTestCase(FastTenantTestCase):
-    """
-    Tests for model Course
-    """
 
-    def setUp(self):
-        self.course = Course.objects.create(name="TestCourse")
+@pytest.fixture
+def writer_type_service(service):
+    return WriterTypeService.objects.create(
+        writer_type=WriterType.objects.create(name="Premium"),
+        service=service,
+        amount=10.00,
+    )
 
-    def test_course_creation(self):
-        """Ensure we can create a course object."""
-        self.assertTrue(isinstance(self.course, Course))
-        self.assertEqual(self.course.__str__(), self.course.name)
 
+def test_level_creation():
+    """Ensure we can create a level object."""
+    level = Level(name="TestLevel")
+    assert isinstance(level, Level)
+    assert level.__str__() == level.name
 
-class PaperTestCase(FastTenantTestCase):
-    """
-    Tests for model Paper
-    """
 
-    def setUp(self):
-        self.paper = Paper.objects.create(name="TestPaper")
+def test_course_creation():
+    """Ensure we can create a course object."""
+    course = Course(name="TestCourse")
+    assert isinstance(course, Course)
+    assert course.__str__() == course.name
 
-    def test_paper_creation(self):
-        """Ensure we can create a paper object."""
-        self.assertTrue(isinstance(self.paper, Paper))
-        self.assertEqual(self.paper.__str__(), self.paper.name)
 
+def test_paper_creation():
+    """Ensure we can create a paper object."""
+    paper = Paper(name="TestPaper")
+    assert isinstance(paper, Paper)
+    assert paper.__str__() == paper.name
 
-class FormatTestCase(FastTenantTestCase):
-    """
-    Tests for model Format
-    """
 
-    def setUp(self):
-        self.format = Format.objects.create(name="TestFormat")
+def test_format_creation():
+    """Ensure we can create a format object."""
+    paper_format = Format(name="TestFormat")
+    assert isinstance(paper_format, Format)
+    assert paper_format.__str__() == paper_format.name
 
-    def test_format_creation(self):
-        """Ensure we can create a format object."""
-        self.assertTrue(isinstance(self.format, Format))
-        self.assertEqual(self.format.__str__(), self.format.name)
 
+def test_deadline_creation():
+    """Ensure we can create a deadline object."""
+    deadline = Deadline(value=1, deadline_type=DAY)
+    assert isinstance(deadline, Deadline)
+    assert deadline.__str__() == deadline.full_name
 
-class DeadlineTestCase(FastTenantTestCase):
-    """
-    Tests for model Deadline
-    """
 
-    def setUp(self):
-        self.deadline_one_day = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY
-        )
-        self.deadline_one_hour = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.HOUR
-        )
-
-    def test_deadline_creation(self):
-        """Ensure we can create a deadline object."""
-        self.assertTrue(isinstance(self.deadline_one_day, Deadline))
-        self.assertEqual(
-            self.deadline_one_day.__str__(), self.deadline_one_day.full_name
-        )
-
-    def test_deadline_full_name(self):
-        """Ensure the full name for deadline object is correct."""
-        deadline_two_days = Deadline.objects.create(
-            value=2, deadline_type=Deadline.DeadlineType.DAY
-        )
-        deadline_two_hours = Deadline.objects.create(
-            value=2, deadline_type=Deadline.DeadlineType.HOUR
-        )
-
-        self.assertEqual(self.deadline_one_day.full_name, "1 Day")
-        self.assertEqual(deadline_two_days.full_name, "2 Days")
-        self.assertEqual(self.deadline_one_hour.full_name, "1 Hour")
-        self.assertEqual(deadline_two_hours.full_name, "2 Hours")
-
-    def test_dealine_duration_day(self):
-        """Ensure the duration for a deadline object of type DAY is correct."""
-        self.assertEqual(self.deadline_one_day.duration, timedelta(days=1))
-
-    def test_deadline_duration_hour(self):
-        """Ensure the duration for a dealine object of type HOUR is correct."""
-        self.assertEqual(self.deadline_one_hour.duration, timedelta(hours=1))
-
-    def test_deadline_due_date_day(self):
-        """Ensure the due date for a deadline object of type DAY is correct."""
-        start = timezone.now()
-        self.assertEqual(
-            self.deadline_one_day.get_due_date(start), start + timedelta(days=1)
-        )
-
-    def test_deadline_due_date_hour(self):
-        """Ensure that the due date for dedaline object of type HOUR is correct."""
-        start = timezone.now()
-        self.assertEqual(
-            self.deadline_one_hour.get_due_date(start), start + timedelta(hours=1)
-        )
+@pytest.mark.parametrize(
+    "value,deadline_type,full_name,duration,due_date",
+    [
+        (1, DAY, "1 Day", timedelta(days=1), START + timedelta(days=1)),
+        (1, HOUR, "1 Hour", timedelta(hours=1), START + timedelta(hours=1)),
+        (2, DAY, "2 Days", timedelta(days=2), START + timedelta(days=2)),
+        (2, HOUR, "2 Hours", timedelta(hours=2), START + timedelta(hours=2)),
+    ],
+)
+def test_deadline_computed_fields(value, deadline_type, full_name, duration, due_date):
+    """Ensure full name, duration and due date of a deadline are correct."""
+    deadline = Deadline(value=value, deadline_type=deadline_type)
+    assert deadline.full_name == full_name
+    assert deadline.duration == duration
+    assert deadline.get_due_date(START) == due_date
 
 
-class ServiceTestCase(FastTenantTestCase):
+@pytest.mark.django_db
+class TestService:
     """Tests for model Service"""
 
-    def setUp(self):
-        self.level = Level.objects.create(name="TestLevel")
-        self.deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY
-        )
-        self.paper = Paper.objects.create(name="TestPaper")
-        self.service = Service.objects.create(
-            level=self.level, deadline=self.deadline, paper=self.paper, amount=10.00
-        )
-
-    def test_creation(self):
+    def test_creation(self, service):
         """Ensure we can create a Service object"""
-        self.assertTrue(isinstance(self.service, Service))
-        self.assertEqual(f"{self.service}", "TestPaper - TestLevel - 1 Day")
-        self.assertEqual(self.service.level, self.level)
-        self.assertEqual(self.service.deadline, self.deadline)
-        self.assertEqual(self.service.paper, self.paper)
-        self.assertEqual(self.service.amount, 10.00)
-
-    def test_level_optional(self):
+        assert isinstance(service, Service)
+        assert service.level.name == "TestLevel"
+        assert service.deadline.value == 1
+        assert service.paper.name == "TestPaper"
+        assert service.amount == 10.00
+
+    @mock.patch.object(
+        Deadline, "full_name", new_callable=mock.PropertyMock, return_value="Deadline"
+    )
+    def test_str_representation(self, _, service):
+        """Ensure the string representation of a Service object is correct"""
+        assert f"{service}" == "TestPaper - TestLevel - Deadline"
+
+    def test_level_optional(self, service):
         """Ensure level is optional"""
         service = Service.objects.create(
-            deadline=self.deadline, paper=self.paper, amount=5.00
+            deadline=service.deadline, paper=service.paper, amount=5.00
         )
-        self.assertEqual(service.level, None)
+        assert service.level is None
 
-    def test_unique_together(self):
+    def test_unique_together(self, service):
         """Ensure level, deadline and paper are unique"""
-        with self.assertRaises(IntegrityError):
+        with pytest.raises(IntegrityError, match=UNIQUE_VIOLATION):
             Service.objects.create(
-                level=self.level, deadline=self.deadline, paper=self.paper
+                level=service.level,
+                deadline=service.deadline,
+                paper=service.paper,
+                amount=5.00,
             )
 
 
-class WriterTypeTestCase(FastTenantTestCase):
+@pytest.mark.django_db
+class TestWriterType:
     """Tests for model WriterType"""
 
-    def setUp(self):
-        self.writer_type = WriterType.objects.create(
-            name="Test",
-            sort_order=1,
-            description="Awesome description here",
-        )
-
-    def test_creation(self):
+    def test_creation(self, writer_type):
         """Ensure we can create a WriterType object"""
-        self.assertTrue(isinstance(self.writer_type, WriterType))
-        self.assertEqual(f"{self.writer_type}", "Test")
-        self.assertEqual(self.writer_type.name, "Test")
-        self.assertEqual(self.writer_type.sort_order, 1)
-        self.assertEqual(self.writer_type.description, "Awesome description here")
+        assert isinstance(writer_type, WriterType)
+        assert f"{writer_type}" == "Test"
+        assert writer_type.name == "Test"
+        assert writer_type.sort_order == 1
+        assert writer_type.description == "Awesome description here"
 
-    def test_name_length(self):
+    def test_name_length(self, use_tenant_connection):
         """Test name field does not exceed 32 chars"""
+        assert WriterType._meta.get_field("name").max_length == 32
+
         # 33 chars raises error
-        with transaction.atomic(), self.assertRaises(DataError):
+        with pytest.raises(DataError):
             WriterType.objects.create(name="Lorem Ipsum is simply dummy texty")
 
-        # 32 chars does not raise error
-        WriterType.objects.create(name="Lorem Ipsum is simply dummy text")
-
-    def test_description_length(self):
+    def test_description_length(self, use_tenant_connection):
         """Test description field does not exceed 160 chars"""
+        assert WriterType._meta.get_field("description").max_length == 160
+
         # 161 chars raises error
-        with transaction.atomic(), self.assertRaises(DataError):
+        with pytest.raises(DataError):
             WriterType.objects.create(
                 name="Standard",
                 description="""Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud""",
             )
 
-        # 160 chars does not raise error
-        WriterType.objects.create(
-            name="Standard",
-            description="""Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostru""",
-        )
-
-    def test_defaults(self):
+    def test_defaults(self, use_tenant_connection):
         """Ensure the default fields for non required fields are correct"""
         writer_type = WriterType.objects.create(name="Test")
-        self.assertEqual(writer_type.sort_order, 0)
-        self.assertEqual(writer_type.description, None)
+        assert writer_type.sort_order == 0
+        assert writer_type.description is None
 
 
-class WriterTypeServiceTestCase(FastTenantTestCase):
-    """Tests for model Writer"""
+@pytest.mark.django_db
+class TestWriterTypeService:
+    """Tests for model WriterTypeService"""
 
-    def setUp(self):
-        level = Level.objects.create(name="TestLevel")
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY
-        )
-        paper = Paper.objects.create(name="TestPaper")
-        self.service = Service.objects.create(
-            level=level, deadline=deadline, paper=paper, amount=5.00
-        )
-        self.writer_type = WriterType.objects.create(name="Premium")
-        self.writer_type_service = WriterTypeService.objects.create(
-            writer_type=self.writer_type, service=self.service, amount=10.00
-        )
-
-    def test_creation(self):
+    def test_creation(self, writer_type_service, service):
         """Ensure we can create a `WriterTypeService` object"""
-        self.assertTrue(isinstance(self.writer_type_service, WriterTypeService))
-        self.assertEqual(
-            f"{self.writer_type_service}", "Premium - TestPaper - TestLevel - 1 Day"
-        )
-        self.assertEqual(self.writer_type_service.writer_type, self.writer_type)
-        self.assertEqual(self.writer_type_service.service, self.service)
-
-    def test_writer_type_service_unique(self):
+        assert isinstance(writer_type_service, WriterTypeService)
+        assert writer_type_service.writer_type.name == "Premium"
+        assert writer_type_service.service == service
+
+    @mock.patch.object(
+        Deadline, "full_name", new_callable=mock.PropertyMock, return_value="Deadline"
+    )
+    def test_str_representation(self, _, writer_type_service):
+        """Ensure the string representation of a `WriterTypeService` is correct"""
+        assert f"{writer_type_service}" == "Premium - TestPaper - TestLevel - Deadline"
+
+    def test_writer_type_service_unique(self, writer_type_service):
         """Ensure write_type and service are unique together"""
-        with self.assertRaises(IntegrityError):
+        with pytest.raises(IntegrityError, match=UNIQUE_VIOLATION):
             WriterTypeService.objects.create(
-                writer_type=self.writer_type, service=self.service, amount=10.00
+                writer_type=writer_type_service.writer_type,
+                service=writer_type_service.service,
+                amount=10.00,
             )
@@ -0,0 +1,13 @@
+"""Serializers"""
+
+import pytest
+
+from ..serializers import WriterTypeServiceSerializer
+
+
+@pytest.mark.parametrize("field", ["level", "deadline", "paper"])
+def test_writer_type_service_invalid_id(field):
+    """Ensure a validation error is raised if an id is not a UUID"""
+    serializer = WriterTypeServiceSerializer(data={field: "871"})
+    assert not serializer.is_valid()
+    assert serializer.errors[field][0].code == "invalid"
@@ -0,0 +1,148 @@
+"""Utility methods"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.signals import post_delete, post_save
+
+from ..models import Deadline, Level, Paper, Service
+from ..serializers import CreatePricesSerializer
+from ..signals import clear_services_cache
+from ..utils import get_service, get_services_cache_key
+
+
+@pytest.fixture
+def service(use_tenant_connection):
+    """Service together with the level, deadline and paper it uses"""
+    return Service.objects.create(
+        level=Level.objects.create(name="TestLevel"),
+        deadline=Deadline.objects.create(
+            value=1, deadline_type=Deadline.DeadlineType.DAY
+        ),
+        paper=Paper.objects.create(name="TestPaper"),
+        amount=10.00,
+    )
+
+
+@pytest.fixture
+def services_cache_signals():
+    """Connect the receivers that clear the cached services
+
+    Signals are muted for the test session
+    """
+    post_save.connect(clear_services_cache, sender=Service)
+    post_delete.connect(clear_services_cache, sender=Service)
+
+    yield
+
+    post_save.disconnect(clear_services_cache, sender=Service)
+    post_delete.disconnect(clear_services_cache, sender=Service)
+
+
+def test_services_cache_key(use_fast_tenant):
+    """The cache key is scoped to the tenant"""
+    connection.set_tenant(use_fast_tenant)
+    tenant_key = get_services_cache_key("paper", "deadline")
+    connection.set_schema_to_public()
+    public_key = get_services_cache_key("paper", "deadline")
+
+    assert tenant_key == f"services:{use_fast_tenant.schema_name}:paper:deadline"
+    assert public_key == "services:public:paper:deadline"
+
+
+@pytest.mark.django_db
+class TestGetService:
+    """Tests for get_service"""
+
+    def test_cache_hit(
+        self, service, use_locmem_cache_backend, django_assert_num_queries
+    ):
+        """The services are only queried once"""
+        with django_assert_num_queries(1):
+            get_service(service.paper_id, service.deadline_id, service.level_id)
+
+        with django_assert_num_queries(0):
+            cached_service = get_service(
+                service.paper_id, service.deadline_id, service.level_id
+            )
+
+        assert cached_service == service
+
+    def test_cleared_on_save(
+        self,
+        service,
+        use_locmem_cache_backend,
+        services_cache_signals,
+        django_assert_num_queries,
+        django_capture_on_commit_callbacks,
+    ):
+        """Saving a service clears the cached services"""
+        get_service(service.paper_id, service.deadline_id, service.level_id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            service.amount = 20.00
+            service.save()
+
+        with django_assert_num_queries(1):
+            updated_service = get_service(
+                service.paper_id, service.deadline_id, service.level_id
+            )
+
+        assert updated_service.amount == 20
+
+    def test_cleared_on_delete(
+        self,
+        service,
+        use_locmem_cache_backend,
+        services_cache_signals,
+        django_capture_on_commit_callbacks,
+    ):
+        """Deleting a service clears the cached services"""
+        get_service(service.paper_id, service.deadline_id, service.level_id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            service.delete()
+
+        assert (
+            get_service(service.paper_id, service.deadline_id, service.level_id)
+            is None
+        )
+
+    def test_cleared_after_price_replace(
+        self,
+        service,
+        use_locmem_cache_backend,
+        services_cache_signals,
+        django_capture_on_commit_callbacks,
+    ):
+        """Services cached while the prices are replaced are cleared on commit"""
+        serializer = CreatePricesSerializer(
+            data={
+                "paper_id": str(service.paper_id),
+                "prices": [
+                    {
+                        "deadline_id": str(service.deadline_id),
+                        "level_id": str(service.level_id),
+                        "amount": 20.00,
+                    }
+                ],
+            }
+        )
+        serializer.is_valid(raise_exception=True)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            serializer.save()
+            # A quote made before the commit still reads the previous prices
+            cache.set(
+                get_services_cache_key(service.paper_id, service.deadline_id),
+                [service],
+            )
+
+        assert (
+            cache.get(get_services_cache_key(service.paper_id, service.deadline_id))
+            is None
+        )
+        updated_service = get_service(
+            service.paper_id, service.deadline_id, service.level_id
+        )
+        assert updated_service.amount == 20
@@ -1,21 +1,19 @@
-import json
-from datetime import timedelta
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from types import SimpleNamespace
+from unittest import mock
 
-import dateutil
 import pytest
-from django.core.serializers.json import DjangoJSONEncoder
-from django.http import SimpleCookie
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
-from django_tenants.test.cases import FastTenantTestCase
-from django_tenants.test.client import TenantClient
 from rest_framework import status
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken
 
-from apps.common.utils import reverse_querystring
 from apps.coupon.models import Coupon
 from apps.orders.models import Order
-from apps.subscription.models import Subscription
 from apps.users.models import User
 
 from ..models import (
@@ -30,1019 +28,626 @@ from ..models import (
     WriterTypeTag,
 )
 
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-@pytest.mark.django_db
-class TestGetLevels:
-    """Tests for get levels"""
 
-    @pytest.fixture
-    def create_levels(self):
-        paper = Paper.objects.create(name="Thesis")
-        level_1 = Level.objects.create(name="High School", sort_order=0)
-        level_2 = Level.objects.create(name="Undergraduate", sort_order=1)
-        level_3 = Level.objects.create(name="Masters", sort_order=2)
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY
-        )
-        Service.objects.create(
-            level=level_1, deadline=deadline, paper=paper, amount=5.00
-        )
-        Service.objects.create(
-            level=level_3, deadline=deadline, paper=paper, amount=5.00
-        )
+@lru_cache(maxsize=None)
+def cached_reverse(viewname):
+    """Reverse a URL that takes no arguments once per view name"""
+    return reverse(viewname)
 
-        return locals()
-
-    def test_authentication(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        response = fast_tenant_client.get(reverse("level-list"))
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_staff_user(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        create_levels,
-        store_staff,
-        create_active_subscription,
-    ):
-        """Returns response for staff user"""
-        level_1 = create_levels["level_1"]
-        level_2 = create_levels["level_2"]
-        level_3 = create_levels["level_3"]
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.get(reverse("level-list"))
-        assert response.status_code == status.HTTP_200_OK
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            [
-                {
-                    "id": str(level_1.pk),
-                    "name": level_1.name,
-                    "sort_order": level_1.sort_order,
-                },
-                {
-                    "id": str(level_2.pk),
-                    "name": level_2.name,
-                    "sort_order": level_2.sort_order,
-                },
-                {
-                    "id": str(level_3.pk),
-                    "name": level_3.name,
-                    "sort_order": level_3.sort_order,
-                },
-            ],
-            cls=DjangoJSONEncoder,
-        )
-
-    def test_only_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non staff users cannot get all levels"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.get(reverse("level-list"))
-        assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_paper_filter(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        create_levels,
-        store_staff,
-        create_active_subscription,
-    ):
-        """Ensure that `paper` query param filter works"""
-        level_1 = create_levels["level_1"]
-        level_3 = create_levels["level_3"]
-        paper = create_levels["paper"]
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.get(
-            reverse_querystring("level-list", query_kwargs={"paper": paper.pk})
-        )
-        assert response.status_code == status.HTTP_200_OK
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            [
-                {
-                    "id": str(level_1.pk),
-                    "name": level_1.name,
-                    "sort_order": level_1.sort_order,
-                },
-                {
-                    "id": str(level_3.pk),
-                    "name": level_3.name,
-                    "sort_order": level_3.sort_order,
-                },
-            ],
-            cls=DjangoJSONEncoder,
+@pytest.fixture(scope="class")
+def store_staff(class_tenant_db, test_password):
+    """Store staff shared by all the tests in a class"""
+    with class_tenant_db() as created:
+        user = User.objects.create(
+            username="store_staff",
+            profile_type=User.ProfileType.STAFF,
+            is_email_verified=True,
+            password=test_password,
         )
+        created.append(user)
 
+    return user
 
-@pytest.mark.django_db
-class TestCreateLevel:
-    """Tests for create level"""
-
-    valid_payload = {"name": "Masters", "sort_order": 1}
-
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        response = fast_tenant_client.post(reverse("level-list"), data={})
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """Store staff can create academic level"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
+@pytest.fixture(scope="class")
+def customer(class_tenant_db, test_password):
+    """Customer shared by all the tests in a class"""
+    with class_tenant_db() as created:
+        user = User.objects.create(
+            username="store_customer",
+            profile_type=User.ProfileType.CUSTOMER,
+            is_email_verified=True,
+            password=test_password,
         )
-        response = fast_tenant_client.post(
-            reverse("level-list"), data=TestCreateLevel.valid_payload
-        )
-        assert response.status_code == status.HTTP_201_CREATED
+        created.append(user)
 
-    def test_only_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non-staff is not allowed to create level"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("level-list"), data=TestCreateLevel.valid_payload
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_name_required(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """name is required"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("level-list"), data={"sort_order": 1}
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        response = fast_tenant_client.post(
-            reverse("level-list"), data={"name": "", "sort_order": 1}
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    return user
 
 
-@pytest.mark.django_db
-class TestUpdateLevel:
-    """Tests for update level"""
-
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        level = Level.objects.create(name="High School", sort_order=0)
-        response = fast_tenant_client.put(
-            reverse("level-detail", kwargs={"pk": level.pk}), data={}
-        )
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_valid_payload(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """Updates level"""
-        level = Level.objects.create(name="High School", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("level-detail", kwargs={"pk": level.pk}),
-            data=json.dumps(
-                {"name": "Doctorate", "sort_order": 7}, cls=DjangoJSONEncoder
-            ),
-            content_type="application/json",
-        )
-        assert response.status_code == status.HTTP_200_OK
-        level.refresh_from_db()
-        assert level.name == "Doctorate"
-        assert level.sort_order == 7
-
-    def test_only_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non-staff users cannot update"""
-        level = Level.objects.create(name="Undergraduate", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("level-detail", kwargs={"pk": level.pk}),
-            data=json.dumps(
-                {"name": "Doctorate", "sort_order": 7}, cls=DjangoJSONEncoder
-            ),
-            content_type="application/json",
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_name_required(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """name is required"""
-        level = Level.objects.create(name="High School", sort_order=0)
-
-        # blank is not allowed
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("level-detail", kwargs={"pk": level.pk}),
-            data=json.dumps({"name": "", "sort_order": 7}, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        # none is not allowed
-        response = fast_tenant_client.put(
-            reverse("level-detail", kwargs={"pk": level.pk}),
-            data=json.dumps({"sort_order": 7}, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-
-@pytest.mark.django_db
-class TestDeleteLevel:
-    """Tests for delete level"""
+@pytest.fixture(scope="class")
+def deadline(class_tenant_db):
+    """Deadline shared by all the tests in a class
 
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        level = Level.objects.create(name="High School", sort_order=0)
-
-        response = fast_tenant_client.delete(
-            reverse("level-detail", kwargs={"pk": level.pk})
+    Each test runs in a transaction that is rolled back, so changes made by
+    a test to the deadline row are not seen by the next one
+    """
+    with class_tenant_db() as created:
+        deadline = Deadline.objects.create(
+            value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
         )
+        created.append(deadline)
 
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    return deadline
 
-    def test_valid_level(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """Deletes level"""
-        level = Level.objects.create(name="High School", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("level-detail", kwargs={"pk": level.pk})
-        )
 
-        assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert Level.objects.filter(name="High School").count() == 0
+@pytest.fixture(scope="class")
+def deadline_url(deadline):
+    """Detail URL of the class deadline"""
+    return reverse("deadline-detail", kwargs={"pk": deadline.pk})
 
-    def test_only_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non-staff users cannot delete"""
-        level = Level.objects.create(name="Undergraduate", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("level-detail", kwargs={"pk": level.pk})
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
 
+@pytest.fixture(scope="class")
+def staff_token(store_staff):
+    """Access token for store staff, signed once per class"""
+    return str(AccessToken.for_user(store_staff))
 
-@pytest.mark.django_db
-class TestGetCourses:
-    """Tests for get courses"""
 
-    @pytest.fixture()
-    def create_courses(self):
-        course_1 = Course.objects.create(name="Tourism", sort_order=3)
-        course_2 = Course.objects.create(name="Business", sort_order=1)
-        course_3 = Course.objects.create(name="Nursing", sort_order=0)
+@pytest.fixture(scope="class")
+def customer_token(customer):
+    """Access token for customer, signed once per class"""
+    return str(AccessToken.for_user(customer))
 
-        return locals()
 
-    def test_get_all_courses(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        create_courses,
-        create_active_subscription,
-    ):
-        """Ensure response for GET all courses is correct"""
-        course_1 = create_courses["course_1"]
-        course_2 = create_courses["course_2"]
-        course_3 = create_courses["course_3"]
-        response = fast_tenant_client.get(reverse("course-list"))
-        assert response.status_code == status.HTTP_200_OK
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            [
-                {
-                    "id": str(course_3.pk),
-                    "name": course_3.name,
-                    "sort_order": course_3.sort_order,
-                },
-                {
-                    "id": str(course_2.pk),
-                    "name": course_2.name,
-                    "sort_order": course_2.sort_order,
-                },
-                {
-                    "id": str(course_1.pk),
-                    "name": course_1.name,
-                    "sort_order": course_1.sort_order,
-                },
-            ],
-            cls=DjangoJSONEncoder,
-        )
+NAMED_ITEMS = [
+    pytest.param(Level, "level", id="level"),
+    pytest.param(Course, "course", id="course"),
+    pytest.param(Format, "format", id="format"),
+]
 
 
 @pytest.mark.django_db
-class TestCreateCourse:
-    """Tests for create course"""
-
-    valid_payload = {"name": "Nursing", "sort_order": 1}
-
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        response = fast_tenant_client.post(reverse("course-list"), data={})
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_valid_payload(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """Valid payload creates course"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("course-list"), data=TestCreateCourse.valid_payload
-        )
-        assert response.status_code == status.HTTP_201_CREATED
-
-    def test_non_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non-staff user is not allowed to create"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("course-list"), data=TestCreateCourse.valid_payload
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_name_required(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """name is required"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("course-list"),
-            data={"name": "", "sort_order": 1},
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        response = fast_tenant_client.post(
-            reverse("course-list"), data={"sort_order": 1}
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
+class TestGetLevels:
+    """Tests for get levels"""
 
-@pytest.mark.django_db
-class TestUpdateCourse:
-    """Tests for update course"""
+    @pytest.fixture(scope="class")
+    def create_levels(self, class_tenant_db):
+        with class_tenant_db() as created:
+            paper = Paper.objects.create(name="Thesis")
+            deadline = Deadline.objects.create(
+                value=1, deadline_type=Deadline.DeadlineType.DAY
+            )
+            level_1, level_2, level_3 = Level.objects.bulk_create(
+                [
+                    Level(name="High School", sort_order=0),
+                    Level(name="Undergraduate", sort_order=1),
+                    Level(name="Masters", sort_order=2),
+                ]
+            )
+            services = Service.objects.bulk_create(
+                [
+                    Service(level=level_1, deadline=deadline, paper=paper, amount=5.00),
+                    Service(level=level_3, deadline=deadline, paper=paper, amount=5.00),
+                ]
+            )
+            created += [paper, deadline, level_1, level_2, level_3, *services]
 
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        course = Course.objects.create(name="Tourism", sort_order=0)
-        response = fast_tenant_client.put(
-            reverse("course-detail", kwargs={"pk": course.pk}), data={}
+        return SimpleNamespace(
+            paper=paper, level_1=level_1, level_2=level_2, level_3=level_3
         )
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_valid_payload(
+    def test_staff_user(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        create_levels,
+        class_active_subscription,
     ):
-        """Updates successfully"""
-        course = Course.objects.create(name="Tourism", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("course-detail", kwargs={"pk": course.pk}),
-            data=json.dumps(
-                {"name": "Mathematics", "sort_order": 7}, cls=DjangoJSONEncoder
-            ),
-            content_type="application/json",
-        )
+        """Returns response for staff user"""
+        level_1 = create_levels.level_1
+        level_2 = create_levels.level_2
+        level_3 = create_levels.level_3
+        response = staff_client.get(cached_reverse("level-list"))
         assert response.status_code == status.HTTP_200_OK
-        course.refresh_from_db()
-        assert course.name == "Mathematics"
-        assert course.sort_order == 7
+        assert response.data == [
+            {
+                "id": str(level_1.pk),
+                "name": level_1.name,
+                "sort_order": level_1.sort_order,
+            },
+            {
+                "id": str(level_2.pk),
+                "name": level_2.name,
+                "sort_order": level_2.sort_order,
+            },
+            {
+                "id": str(level_3.pk),
+                "name": level_3.name,
+                "sort_order": level_3.sort_order,
+            },
+        ]
 
     def test_only_staff(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
+        customer_client,
+        class_active_subscription,
     ):
-        """Non-staff users cannot update"""
-        course = Course.objects.create(name="Business", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("course-detail", kwargs={"pk": course.pk}),
-            data=json.dumps(
-                {"name": "Mathematics", "sort_order": 7}, cls=DjangoJSONEncoder
-            ),
-            content_type="application/json",
-        )
+        """Non staff users cannot get all levels"""
+        response = customer_client.get(cached_reverse("level-list"))
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_name_required(
+    def test_paper_filter(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        create_levels,
+        class_active_subscription,
     ):
-        """name is required"""
-        course = Course.objects.create(name="Business", sort_order=0)
-
-        # blank is not allowed
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("course-detail", kwargs={"pk": course.pk}),
-            data=json.dumps({"name": "", "sort_order": 7}, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        # none is not allowed
-        response = fast_tenant_client.put(
-            reverse("course-detail", kwargs={"pk": course.pk}),
-            data=json.dumps({"sort_order": 7}, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        """Ensure that `paper` query param filter works"""
+        level_1 = create_levels.level_1
+        level_3 = create_levels.level_3
+        paper = create_levels.paper
+        response = staff_client.get(f'{cached_reverse("level-list")}?paper={paper.pk}')
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {
+                "id": str(level_1.pk),
+                "name": level_1.name,
+                "sort_order": level_1.sort_order,
+            },
+            {
+                "id": str(level_3.pk),
+                "name": level_3.name,
+                "sort_order": level_3.sort_order,
+            },
+        ]
 
 
 @pytest.mark.django_db
-class TestDeleteCourse:
-    """Tests for delete course"""
-
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        course = Course.objects.create(name="Tourism", sort_order=0)
-
-        response = fast_tenant_client.delete(
-            reverse("course-detail", kwargs={"pk": course.pk})
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+class TestGetCourses:
+    """Tests for get courses"""
 
-    def test_valid_course(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """Deletes course"""
-        course = Course.objects.create(name="Tourism", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("course-detail", kwargs={"pk": course.pk})
-        )
+    @pytest.fixture(scope="class")
+    def create_courses(self, class_tenant_db):
+        with class_tenant_db() as created:
+            course_1, course_2, course_3 = Course.objects.bulk_create(
+                [
+                    Course(name="Tourism", sort_order=3),
+                    Course(name="Business", sort_order=1),
+                    Course(name="Nursing", sort_order=0),
+                ]
+            )
+            created += [course_1, course_2, course_3]
 
-        assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert Course.objects.filter(name="Tourism").count() == 0
+        return SimpleNamespace(course_1=course_1, course_2=course_2, course_3=course_3)
 
-    def test_only_staff(
+    def test_get_all_courses(
         self,
         use_tenant_connection,
         fast_tenant_client,
-        customer,
-        create_active_subscription,
+        create_courses,
+        class_active_subscription,
     ):
-        """Non-staff users cannot delete"""
-        course = Course.objects.create(name="Tourism", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("course-detail", kwargs={"pk": course.pk})
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        """Ensure response for GET all courses is correct"""
+        course_1 = create_courses.course_1
+        course_2 = create_courses.course_2
+        course_3 = create_courses.course_3
+        response = fast_tenant_client.get(cached_reverse("course-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {
+                "id": str(course_3.pk),
+                "name": course_3.name,
+                "sort_order": course_3.sort_order,
+            },
+            {
+                "id": str(course_2.pk),
+                "name": course_2.name,
+                "sort_order": course_2.sort_order,
+            },
+            {
+                "id": str(course_1.pk),
+                "name": course_1.name,
+                "sort_order": course_1.sort_order,
+            },
+        ]
 
 
 @pytest.mark.django_db
 class TestGetFormats:
     """Tests for get formats"""
 
-    @pytest.fixture()
-    def create_formats(self):
-        format_1 = Format.objects.create(name="APA", sort_order=3)
-        format_2 = Format.objects.create(name="Chicago", sort_order=1)
-        format_3 = Format.objects.create(name="MLA", sort_order=0)
+    @pytest.fixture(scope="class")
+    def create_formats(self, class_tenant_db):
+        with class_tenant_db() as created:
+            format_1, format_2, format_3 = Format.objects.bulk_create(
+                [
+                    Format(name="APA", sort_order=3),
+                    Format(name="Chicago", sort_order=1),
+                    Format(name="MLA", sort_order=0),
+                ]
+            )
+            created += [format_1, format_2, format_3]
 
-        return locals()
+        return SimpleNamespace(format_1=format_1, format_2=format_2, format_3=format_3)
 
     def test_get_all_formats(
         self,
         use_tenant_connection,
         fast_tenant_client,
         create_formats,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """Ensure response for GET all formats is correct"""
-        format_1 = create_formats["format_1"]
-        format_2 = create_formats["format_2"]
-        format_3 = create_formats["format_3"]
-        response = fast_tenant_client.get(reverse("format-list"))
+        format_1 = create_formats.format_1
+        format_2 = create_formats.format_2
+        format_3 = create_formats.format_3
+        response = fast_tenant_client.get(cached_reverse("format-list"))
         assert response.status_code == status.HTTP_200_OK
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            [
-                {
-                    "id": str(format_3.pk),
-                    "name": format_3.name,
-                    "sort_order": format_3.sort_order,
-                },
-                {
-                    "id": str(format_2.pk),
-                    "name": format_2.name,
-                    "sort_order": format_2.sort_order,
-                },
-                {
-                    "id": str(format_1.pk),
-                    "name": format_1.name,
-                    "sort_order": format_1.sort_order,
-                },
-            ],
-            cls=DjangoJSONEncoder,
-        )
+        assert response.data == [
+            {
+                "id": str(format_3.pk),
+                "name": format_3.name,
+                "sort_order": format_3.sort_order,
+            },
+            {
+                "id": str(format_2.pk),
+                "name": format_2.name,
+                "sort_order": format_2.sort_order,
+            },
+            {
+                "id": str(format_1.pk),
+                "name": format_1.name,
+                "sort_order": format_1.sort_order,
+            },
+        ]
 
 
 @pytest.mark.django_db
-class TestCreateFormat:
-    """Tests for create academic level"""
+@pytest.mark.parametrize("model,basename", NAMED_ITEMS)
+class TestCreateNamedItem:
+    """Tests for create level, course and format"""
 
-    valid_payload = {"name": "MLA", "sort_order": 1}
-
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        response = fast_tenant_client.post(reverse("format-list"), data={})
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    valid_payload = {"name": "Masters", "sort_order": 1}
 
-    def test_valid_payload(
+    def test_staff(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        model,
+        basename,
+        class_active_subscription,
     ):
-        """Valid payload creates format"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("format-list"), data=TestCreateFormat.valid_payload
+        """Store staff can create"""
+        response = staff_client.post(
+            cached_reverse(f"{basename}-list"), data=TestCreateNamedItem.valid_payload
         )
         assert response.status_code == status.HTTP_201_CREATED
 
-    def test_non_staff(
+    def test_only_staff(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
+        customer_client,
+        model,
+        basename,
+        class_active_subscription,
     ):
-        """Non-staff user is not allowed to create"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("format-list"), data=TestCreateFormat.valid_payload
+        """Non-staff is not allowed to create"""
+        response = customer_client.post(
+            cached_reverse(f"{basename}-list"), data=TestCreateNamedItem.valid_payload
         )
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    @pytest.mark.parametrize(
+        "payload",
+        [{"name": "", "sort_order": 1}, {"sort_order": 1}],
+        ids=["blank", "missing"],
+    )
     def test_name_required(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        model,
+        basename,
+        payload,
+        class_active_subscription,
     ):
         """name is required"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("format-list"), data={"name": "", "sort_order": 1}
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        response = fast_tenant_client.post(
-            reverse("format-list"), data={"sort_order": 1}
-        )
+        response = staff_client.post(cached_reverse(f"{basename}-list"), data=payload)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
 @pytest.mark.django_db
-class TestUpdateFormat:
-    """Tests for update format"""
+@pytest.mark.parametrize("model,basename", NAMED_ITEMS)
+class TestUpdateNamedItem:
+    """Tests for update level, course and format"""
 
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        format = Format.objects.create(name="APA", sort_order=0)
-        response = fast_tenant_client.put(
-            reverse("format-detail", kwargs={"pk": format.pk}), data={}
-        )
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    valid_payload = {"name": "Doctorate", "sort_order": 7}
+    blank_name_payload = {"name": "", "sort_order": 7}
+    no_name_payload = {"sort_order": 7}
+
+    @pytest.fixture
+    def item(self, use_tenant_connection, model):
+        return model.objects.create(name="High School", sort_order=0)
 
     def test_valid_payload(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        item,
+        basename,
+        class_active_subscription,
     ):
         """Updates successfully"""
-        format = Format.objects.create(name="APA", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("format-detail", kwargs={"pk": format.pk}),
-            data=json.dumps(
-                {"name": "Mathematics", "sort_order": 7}, cls=DjangoJSONEncoder
-            ),
-            content_type="application/json",
+        response = staff_client.put(
+            reverse(f"{basename}-detail", kwargs={"pk": item.pk}),
+            data=TestUpdateNamedItem.valid_payload,
+            format="json",
         )
         assert response.status_code == status.HTTP_200_OK
-        format.refresh_from_db()
-        assert format.name == "Mathematics"
-        assert format.sort_order == 7
+        item.refresh_from_db()
+        assert item.name == "Doctorate"
+        assert item.sort_order == 7
 
     def test_only_staff(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
+        customer_client,
+        dummy_uuid,
+        basename,
+        class_active_subscription,
     ):
         """Non-staff users cannot update"""
-        format = Format.objects.create(name="Chicago", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("format-detail", kwargs={"pk": format.pk}),
-            data=json.dumps(
-                {"name": "Mathematics", "sort_order": 7}, cls=DjangoJSONEncoder
-            ),
-            content_type="application/json",
+        response = customer_client.put(
+            reverse(f"{basename}-detail", kwargs={"pk": dummy_uuid}),
+            data=TestUpdateNamedItem.valid_payload,
+            format="json",
         )
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+    @pytest.mark.parametrize(
+        "payload", [blank_name_payload, no_name_payload], ids=["blank", "missing"]
+    )
     def test_name_required(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        item,
+        basename,
+        payload,
+        class_active_subscription,
     ):
         """name is required"""
-        format = Format.objects.create(name="Chicago", sort_order=0)
-
-        # blank is not allowed
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
+        response = staff_client.put(
+            reverse(f"{basename}-detail", kwargs={"pk": item.pk}),
+            data=payload,
+            format="json",
         )
-        response = fast_tenant_client.put(
-            reverse("format-detail", kwargs={"pk": format.pk}),
-            data=json.dumps({"name": "", "sort_order": 7}, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        # none is not allowed
-        response = fast_tenant_client.put(
-            reverse("format-detail", kwargs={"pk": format.pk}),
-            data=json.dumps({"sort_order": 7}, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
 @pytest.mark.django_db
-class TestDeleteFormat:
-    """Tests for delete format"""
-
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        format = Format.objects.create(name="APA", sort_order=0)
-
-        response = fast_tenant_client.delete(
-            reverse("format-detail", kwargs={"pk": format.pk})
-        )
+@pytest.mark.parametrize("model,basename", NAMED_ITEMS)
+class TestDeleteNamedItem:
+    """Tests for delete level, course and format"""
 
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    @pytest.fixture
+    def item(self, use_tenant_connection, model):
+        return model.objects.create(name="High School", sort_order=0)
 
-    def test_valid_format(
+    def test_valid_item(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        model,
+        item,
+        basename,
+        class_active_subscription,
     ):
-        """Deletes format"""
-        format = Format.objects.create(name="APA", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("format-detail", kwargs={"pk": format.pk})
+        """Deletes item"""
+        response = staff_client.delete(
+            reverse(f"{basename}-detail", kwargs={"pk": item.pk})
         )
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert Format.objects.filter(name="APA").count() == 0
+        assert not model.objects.filter(pk=item.pk).exists()
 
     def test_only_staff(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
+        customer_client,
+        dummy_uuid,
+        basename,
+        class_active_subscription,
     ):
         """Non-staff users cannot delete"""
-        format = Format.objects.create(name="APA", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("format-detail", kwargs={"pk": format.pk})
+        response = customer_client.delete(
+            reverse(f"{basename}-detail", kwargs={"pk": dummy_uuid})
         )
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+@pytest.mark.django_db
+class TestNamedItemAuthRequired:
+    """Tests for authentication on levels, courses and formats"""
+
+    @pytest.mark.parametrize(
+        "method,url_name,pk_required",
+        [
+            ("get", "level-list", False),
+            ("post", "level-list", False),
+            ("put", "level-detail", True),
+            ("delete", "level-detail", True),
+            ("post", "course-list", False),
+            ("put", "course-detail", True),
+            ("delete", "course-detail", True),
+            ("post", "format-list", False),
+            ("put", "format-detail", True),
+            ("delete", "format-detail", True),
+        ],
+    )
+    def test_auth_required(
+        self,
+        use_tenant_connection,
+        fast_tenant_client,
+        dummy_uuid,
+        method,
+        url_name,
+        pk_required,
+        class_active_subscription,
+    ):
+        """Authentication is required"""
+        if pk_required:
+            url = reverse(url_name, kwargs={"pk": dummy_uuid})
+        else:
+            url = cached_reverse(url_name)
+
+        response = getattr(fast_tenant_client, method)(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
 @pytest.mark.django_db
 class TestGetDeadlines:
     """Tests for get deadlines"""
 
-    @pytest.fixture()
-    def create_deadlines(self):
-        deadline_1 = Deadline.objects.create(
-            value=2, deadline_type=Deadline.DeadlineType.DAY, sort_order=1
-        )
-        deadline_2 = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY, sort_order=1
-        )
-        deadline_3 = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
-        )
-        deadline_4 = Deadline.objects.create(
-            value=2, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
-        )
-        paper = Paper.objects.create(name="Thesis")
-        level = Level.objects.create(name="High School", sort_order=0)
-        Service.objects.create(
-            level=level, deadline=deadline_2, paper=paper, amount=5.00
-        )
-        Service.objects.create(
-            level=level, deadline=deadline_3, paper=paper, amount=5.00
-        )
+    @pytest.fixture(scope="class")
+    def create_deadlines(self, class_tenant_db):
+        with class_tenant_db() as created:
+            deadlines = Deadline.objects.bulk_create(
+                [
+                    Deadline(
+                        value=2, deadline_type=Deadline.DeadlineType.DAY, sort_order=1
+                    ),
+                    Deadline(
+                        value=1, deadline_type=Deadline.DeadlineType.DAY, sort_order=1
+                    ),
+                    Deadline(
+                        value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
+                    ),
+                    Deadline(
+                        value=2, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
+                    ),
+                ]
+            )
+            deadline_1, deadline_2, deadline_3, deadline_4 = deadlines
+            paper = Paper.objects.create(name="Thesis")
+            level = Level.objects.create(name="High School", sort_order=0)
+            services = Service.objects.bulk_create(
+                [
+                    Service(level=level, deadline=deadline_2, paper=paper, amount=5.00),
+                    Service(level=level, deadline=deadline_3, paper=paper, amount=5.00),
+                ]
+            )
+            created += [*deadlines, paper, level, *services]
 
-        return locals()
+        return SimpleNamespace(
+            deadline_1=deadline_1,
+            deadline_2=deadline_2,
+            deadline_3=deadline_3,
+            deadline_4=deadline_4,
+            paper=paper,
+            level=level,
+        )
 
     def test_authentication(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
+        self, use_tenant_connection, fast_tenant_client, class_active_subscription
     ):
         """Authentication is required"""
-        response = fast_tenant_client.get(reverse("deadline-list"))
+        response = fast_tenant_client.get(cached_reverse("deadline-list"))
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_staff_user(
         self,
         use_tenant_connection,
-        fast_tenant_client,
+        staff_client,
         create_deadlines,
-        store_staff,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """Returns response for staff user"""
-        deadline_1 = create_deadlines["deadline_1"]
-        deadline_2 = create_deadlines["deadline_2"]
-        deadline_3 = create_deadlines["deadline_3"]
-        deadline_4 = create_deadlines["deadline_4"]
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.get(reverse("deadline-list"))
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            [
-                {
-                    "id": str(deadline_3.pk),
-                    "full_name": deadline_3.full_name,
-                    "value": deadline_3.value,
-                    "deadline_type": deadline_3.deadline_type,
-                    "sort_order": deadline_3.sort_order,
-                },
-                {
-                    "id": str(deadline_4.pk),
-                    "full_name": deadline_4.full_name,
-                    "value": deadline_4.value,
-                    "deadline_type": deadline_4.deadline_type,
-                    "sort_order": deadline_4.sort_order,
-                },
-                {
-                    "id": str(deadline_2.pk),
-                    "full_name": deadline_2.full_name,
-                    "value": deadline_2.value,
-                    "deadline_type": deadline_2.deadline_type,
-                    "sort_order": deadline_2.sort_order,
-                },
-                {
-                    "id": str(deadline_1.pk),
-                    "full_name": deadline_1.full_name,
-                    "value": deadline_1.value,
-                    "deadline_type": deadline_1.deadline_type,
-                    "sort_order": deadline_1.sort_order,
-                },
-            ],
-            cls=DjangoJSONEncoder,
-        )
+        deadline_1 = create_deadlines.deadline_1
+        deadline_2 = create_deadlines.deadline_2
+        deadline_3 = create_deadlines.deadline_3
+        deadline_4 = create_deadlines.deadline_4
+        response = staff_client.get(cached_reverse("deadline-list"))
+        assert response.data == [
+            {
+                "id": str(deadline_3.pk),
+                "full_name": deadline_3.full_name,
+                "value": deadline_3.value,
+                "deadline_type": deadline_3.deadline_type,
+                "sort_order": deadline_3.sort_order,
+            },
+            {
+                "id": str(deadline_4.pk),
+                "full_name": deadline_4.full_name,
+                "value": deadline_4.value,
+                "deadline_type": deadline_4.deadline_type,
+                "sort_order": deadline_4.sort_order,
+            },
+            {
+                "id": str(deadline_2.pk),
+                "full_name": deadline_2.full_name,
+                "value": deadline_2.value,
+                "deadline_type": deadline_2.deadline_type,
+                "sort_order": deadline_2.sort_order,
+            },
+            {
+                "id": str(deadline_1.pk),
+                "full_name": deadline_1.full_name,
+                "value": deadline_1.value,
+                "deadline_type": deadline_1.deadline_type,
+                "sort_order": deadline_1.sort_order,
+            },
+        ]
 
     def test_only_staff(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
+        customer_client,
+        class_active_subscription,
     ):
         """Non staff users cannot get deadlines"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.get(reverse("deadline-list"))
+        response = customer_client.get(cached_reverse("deadline-list"))
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_filters_work(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
+        staff_client,
         create_deadlines,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """Filters work"""
-        deadline_2 = create_deadlines["deadline_2"]
-        deadline_3 = create_deadlines["deadline_3"]
-        paper = create_deadlines["paper"]
-        level = create_deadlines["level"]
-
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.get(
-            reverse_querystring("deadline-list", query_kwargs={"paper": paper.pk})
-        )
+        deadline_2 = create_deadlines.deadline_2
+        deadline_3 = create_deadlines.deadline_3
+        paper = create_deadlines.paper
+        level = create_deadlines.level
 
-        assert response.status_code == status.HTTP_200_OK
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            [
-                {
-                    "id": str(deadline_3.pk),
-                    "full_name": deadline_3.full_name,
-                    "value": deadline_3.value,
-                    "deadline_type": deadline_3.deadline_type,
-                    "sort_order": deadline_3.sort_order,
-                },
-                {
-                    "id": str(deadline_2.pk),
-                    "full_name": deadline_2.full_name,
-                    "value": deadline_2.value,
-                    "deadline_type": deadline_2.deadline_type,
-                    "sort_order": deadline_2.sort_order,
-                },
-            ],
-            cls=DjangoJSONEncoder,
-        )
+        expected = [
+            {
+                "id": str(deadline_3.pk),
+                "full_name": deadline_3.full_name,
+                "value": deadline_3.value,
+                "deadline_type": deadline_3.deadline_type,
+                "sort_order": deadline_3.sort_order,
+            },
+            {
+                "id": str(deadline_2.pk),
+                "full_name": deadline_2.full_name,
+                "value": deadline_2.value,
+                "deadline_type": deadline_2.deadline_type,
+                "sort_order": deadline_2.sort_order,
+            },
+        ]
 
-        response = fast_tenant_client.get(
-            reverse_querystring("deadline-list", query_kwargs={"level": level.pk})
-        )
+        for query in (f"paper={paper.pk}", f"level={level.pk}"):
+            response = staff_client.get(f'{cached_reverse("deadline-list")}?{query}')
 
-        assert response.status_code == status.HTTP_200_OK
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            [
-                {
-                    "id": str(deadline_3.pk),
-                    "full_name": deadline_3.full_name,
-                    "value": deadline_3.value,
-                    "deadline_type": deadline_3.deadline_type,
-                    "sort_order": deadline_3.sort_order,
-                },
-                {
-                    "id": str(deadline_2.pk),
-                    "full_name": deadline_2.full_name,
-                    "value": deadline_2.value,
-                    "deadline_type": deadline_2.deadline_type,
-                    "sort_order": deadline_2.sort_order,
-                },
-            ],
-            cls=DjangoJSONEncoder,
-        )
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data == expected
 
 
 @pytest.mark.django_db
@@ -1051,188 +656,89 @@ class TestCreateDeadline:
 
     valid_payload = {"value": 1, "deadline_type": 1, "sort_order": 0}
 
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        response = fast_tenant_client.post(reverse("deadline-list"), data={})
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_valid_payload(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """Valid payload creates deadline"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("deadline-list"), data=TestCreateDeadline.valid_payload
-        )
-        assert response.status_code == status.HTTP_201_CREATED
-
-    def test_non_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non-staff user is not allowed to create"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("deadline-list"), data=TestCreateDeadline.valid_payload
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_value_required(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """value is required"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("deadline-list"),
-            data={"value": "", "deadline_type": 1, "sort_order": 1},
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        response = fast_tenant_client.post(
-            reverse("deadline-list"), data={"deadline_type": 1, "sort_order": 1}
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-
-@pytest.mark.django_db
-class TestUpdateDeadline:
-    """Tests for update deadline"""
-
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
-        )
-        response = fast_tenant_client.put(
-            reverse("deadline-detail", kwargs={"pk": deadline.pk}), data={}
-        )
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_valid_payload(
         self,
-        use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
-    ):
-        """Updates successfully"""
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
-        )
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("deadline-detail", kwargs={"pk": deadline.pk}),
-            data=json.dumps(
-                {
-                    "value": 2,
-                    "deadline_type": Deadline.DeadlineType.DAY,
-                    "sort_order": 7,
-                },
-                cls=DjangoJSONEncoder,
-            ),
-            content_type="application/json",
-        )
-        assert response.status_code == status.HTTP_200_OK
-        deadline.refresh_from_db()
-        assert deadline.value == 2
-        assert deadline.deadline_type == Deadline.DeadlineType.DAY
-        assert deadline.sort_order == 7
-
-    def test_only_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non-staff users cannot update"""
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
-        )
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("deadline-detail", kwargs={"pk": deadline.pk}),
-            data=json.dumps(
-                {
-                    "value": 2,
-                    "deadline_type": Deadline.DeadlineType.DAY,
-                    "sort_order": 7,
-                },
-                cls=DjangoJSONEncoder,
-            ),
-            content_type="application/json",
+        use_tenant_connection,
+        staff_client,
+        class_active_subscription,
+    ):
+        """Valid payload creates deadline"""
+        response = staff_client.post(
+            cached_reverse("deadline-list"), data=TestCreateDeadline.valid_payload
         )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.status_code == status.HTTP_201_CREATED
 
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"value": "", "deadline_type": 1, "sort_order": 1},
+            {"deadline_type": 1, "sort_order": 1},
+        ],
+        ids=["blank", "missing"],
+    )
     def test_value_required(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        payload,
+        class_active_subscription,
     ):
         """value is required"""
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
-        )
+        response = staff_client.post(cached_reverse("deadline-list"), data=payload)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-        # blank is not allowed
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("deadline-detail", kwargs={"pk": deadline.pk}),
-            data=json.dumps(
-                {
-                    "value": "",
-                    "deadline_type": Deadline.DeadlineType.DAY,
-                    "sort_order": 7,
-                },
-                cls=DjangoJSONEncoder,
-            ),
-            content_type="application/json",
-        )
 
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
+@pytest.mark.django_db
+class TestUpdateDeadline:
+    """Tests for update deadline"""
 
-        # none is not allowed
-        response = fast_tenant_client.put(
-            reverse("deadline-detail", kwargs={"pk": deadline.pk}),
-            data=json.dumps(
-                {
-                    "deadline_type": Deadline.DeadlineType.DAY,
-                    "sort_order": 7,
-                },
-                cls=DjangoJSONEncoder,
-            ),
-            content_type="application/json",
+    def test_valid_payload(
+        self,
+        use_tenant_connection,
+        staff_client,
+        deadline,
+        deadline_url,
+        class_active_subscription,
+    ):
+        """Updates successfully"""
+        response = staff_client.put(
+            deadline_url,
+            data={
+                "value": 2,
+                "deadline_type": Deadline.DeadlineType.DAY,
+                "sort_order": 7,
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        # the deadline is shared by the class, read the update into a new object
+        updated = Deadline.objects.get(pk=deadline.pk)
+        assert updated.value == 2
+        assert updated.deadline_type == Deadline.DeadlineType.DAY
+        assert updated.sort_order == 7
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"value": "", "deadline_type": Deadline.DeadlineType.DAY, "sort_order": 7},
+            {"deadline_type": Deadline.DeadlineType.DAY, "sort_order": 7},
+        ],
+        ids=["blank", "missing"],
+    )
+    def test_value_required(
+        self,
+        use_tenant_connection,
+        staff_client,
+        deadline_url,
+        payload,
+        class_active_subscription,
+    ):
+        """value is required"""
+        response = staff_client.put(
+            deadline_url,
+            data=payload,
+            format="json",
         )
-
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
@@ -1240,129 +746,72 @@ class TestUpdateDeadline:
 class TestDeleteDeadline:
     """Tests for delete deadline"""
 
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
-        )
-
-        response = fast_tenant_client.delete(
-            reverse("deadline-detail", kwargs={"pk": deadline.pk})
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_valid_deadline(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        deadline,
+        deadline_url,
+        class_active_subscription,
     ):
         """Deletes deadline"""
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
-        )
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("deadline-detail", kwargs={"pk": deadline.pk})
-        )
+        response = staff_client.delete(deadline_url)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert (
-            Deadline.objects.filter(
-                value=1, deadline_type=Deadline.DeadlineType.HOUR
-            ).count()
-            == 0
-        )
-
-    def test_only_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non-staff users cannot delete"""
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.HOUR, sort_order=0
-        )
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("deadline-detail", kwargs={"pk": deadline.pk})
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert not Deadline.objects.filter(pk=deadline.pk).exists()
 
 
 @pytest.mark.django_db
 class TestDeadlineExists:
     """Tests for deadline exists check"""
 
-    @pytest.fixture()
-    def create_deadlines(self):
-        deadline_1 = Deadline.objects.create(
-            value=2, deadline_type=Deadline.DeadlineType.DAY, sort_order=1
-        )
+    @pytest.fixture(scope="class")
+    def create_deadlines(self, class_tenant_db):
+        with class_tenant_db() as created:
+            deadline_1 = Deadline.objects.create(
+                value=2, deadline_type=Deadline.DeadlineType.DAY, sort_order=1
+            )
+            created.append(deadline_1)
 
-        return locals()
+        return SimpleNamespace(deadline_1=deadline_1)
 
     def test_authentication(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
+        self, use_tenant_connection, fast_tenant_client, class_active_subscription
     ):
         """Authentication is required"""
-        response = fast_tenant_client.post(reverse("deadline-exists"), data={})
+        response = fast_tenant_client.post(cached_reverse("deadline-exists"), data={})
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_staff_user(
         self,
         use_tenant_connection,
-        fast_tenant_client,
         create_deadlines,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        class_active_subscription,
     ):
         """Returns response for staff user"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("deadline-exists"),
+        response = staff_client.post(
+            cached_reverse("deadline-exists"),
             data={"value": 2, "deadline_type": 2},
         )
         assert response.status_code == status.HTTP_200_OK
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            {"exists": True},
-            cls=DjangoJSONEncoder,
-        )
+        assert response.data == {"exists": True}
         # if deadline does not exists, it returns false
-        response = fast_tenant_client.post(
-            reverse("deadline-exists"),
+        response = staff_client.post(
+            cached_reverse("deadline-exists"),
             data={"value": 3, "deadline_type": 2},
         )
         assert response.status_code == status.HTTP_200_OK
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            {"exists": False},
-            cls=DjangoJSONEncoder,
-        )
+        assert response.data == {"exists": False}
 
     def test_only_staff(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
+        customer_client,
+        class_active_subscription,
     ):
         """Non staff users cannot get deadlines"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.post(reverse("deadline-exists"), data={})
+        response = customer_client.post(cached_reverse("deadline-exists"), data={})
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
@@ -1370,203 +819,219 @@ class TestDeadlineExists:
 class TestGetPapers:
     """Tests for get papers"""
 
-    @pytest.fixture
-    def create_papers(self):
-        paper_1 = Paper.objects.create(name="Thesis", sort_order=3)
-        paper_2 = Paper.objects.create(name="Dissertaion", sort_order=0)  # no service
-        paper_3 = Paper.objects.create(name="Admission Essay", sort_order=2)
-        paper_4 = Paper.objects.create(
-            name="Annotated Bibliography", sort_order=1
-        )  # no level
-        level_1 = Level.objects.create(name="College", sort_order=6)
-        level_2 = Level.objects.create(name="Masters", sort_order=5)
-        deadline_1 = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY
-        )
-        deadline_2 = Deadline.objects.create(
-            value=2, deadline_type=Deadline.DeadlineType.DAY
-        )
-        deadline_3 = Deadline.objects.create(
-            value=3, deadline_type=Deadline.DeadlineType.DAY
-        )
-        Service.objects.create(
-            level=level_2, deadline=deadline_2, paper=paper_1, amount=5.00
-        )
-        Service.objects.create(
-            level=level_1, deadline=deadline_2, paper=paper_3, amount=5.00
+    @pytest.fixture(scope="class")
+    def create_papers(self, class_tenant_db):
+        with class_tenant_db() as created:
+            papers = Paper.objects.bulk_create(
+                [
+                    Paper(name="Thesis", sort_order=3),
+                    Paper(name="Dissertaion", sort_order=0),  # no service
+                    Paper(name="Admission Essay", sort_order=2),
+                    Paper(name="Annotated Bibliography", sort_order=1),  # no level
+                ]
+            )
+            paper_1, paper_2, paper_3, paper_4 = papers
+            level_1, level_2 = Level.objects.bulk_create(
+                [
+                    Level(name="College", sort_order=6),
+                    Level(name="Masters", sort_order=5),
+                ]
+            )
+            deadlines = Deadline.objects.bulk_create(
+                [
+                    Deadline(value=1, deadline_type=Deadline.DeadlineType.DAY),
+                    Deadline(value=2, deadline_type=Deadline.DeadlineType.DAY),
+                    Deadline(value=3, deadline_type=Deadline.DeadlineType.DAY),
+                ]
+            )
+            deadline_1, deadline_2, deadline_3 = deadlines
+            services = Service.objects.bulk_create(
+                [
+                    Service(
+                        level=level_2, deadline=deadline_2, paper=paper_1, amount=5.00
+                    ),
+                    Service(
+                        level=level_1, deadline=deadline_2, paper=paper_3, amount=5.00
+                    ),
+                    Service(deadline=deadline_1, paper=paper_4, amount=5.00),
+                    # paper 4 has another deadline
+                    Service(deadline=deadline_3, paper=paper_4, amount=5.00),
+                ]
+            )
+            created += [*papers, level_1, level_2, *deadlines, *services]
+
+        return SimpleNamespace(
+            paper_1=paper_1,
+            paper_2=paper_2,
+            paper_3=paper_3,
+            paper_4=paper_4,
+            level_1=level_1,
+            level_2=level_2,
+            deadline_1=deadline_1,
+            deadline_2=deadline_2,
+            deadline_3=deadline_3,
         )
-        Service.objects.create(deadline=deadline_1, paper=paper_4, amount=5.00)
-        Service.objects.create(deadline=deadline_3, paper=paper_4, amount=5.00)  # paper
-        # 4 has another deadline
-
-        return locals()
 
     def test_get_service_paper_only(
         self,
         use_tenant_connection,
         fast_tenant_client,
         create_papers,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """Returns only papers that have a service"""
-        paper_1 = create_papers["paper_1"]
-        paper_3 = create_papers["paper_3"]
-        paper_4 = create_papers["paper_4"]
-        level_1 = create_papers["level_1"]
-        level_2 = create_papers["level_2"]
-        deadline_1 = create_papers["deadline_1"]
-        deadline_2 = create_papers["deadline_2"]
-        deadline_3 = create_papers["deadline_3"]
+        paper_1 = create_papers.paper_1
+        paper_3 = create_papers.paper_3
+        paper_4 = create_papers.paper_4
+        level_1 = create_papers.level_1
+        level_2 = create_papers.level_2
+        deadline_1 = create_papers.deadline_1
+        deadline_2 = create_papers.deadline_2
+        deadline_3 = create_papers.deadline_3
 
         response = fast_tenant_client.get(
-            reverse_querystring("paper-list", query_kwargs={"service_only": True})
+            f'{cached_reverse("paper-list")}?service_only=True'
         )
 
         assert response.status_code == status.HTTP_200_OK
         # should only return papers that have an associated service
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            [
-                {
-                    "id": str(paper_4.pk),
-                    "name": paper_4.name,
-                    "sort_order": paper_4.sort_order,
-                    "levels": [],  # if no levels specified show deadlines
-                    "deadlines": [
-                        {
-                            "id": str(deadline_1.pk),
-                            "full_name": str(deadline_1.full_name),
-                        },
-                        {
-                            "id": str(deadline_3.pk),
-                            "full_name": str(deadline_3.full_name),
-                        },
-                    ],
-                },
-                {
-                    "id": str(paper_3.pk),
-                    "name": paper_3.name,
-                    "sort_order": paper_3.sort_order,
-                    "levels": [
-                        {
-                            "id": str(level_1.pk),
-                            "name": level_1.name,
-                            "deadlines": [
-                                {
-                                    "id": str(deadline_2.pk),
-                                    "full_name": deadline_2.full_name,
-                                },
-                            ],
-                        }
-                    ],
-                    "deadlines": [],  # if levels available do not display paper deadlines
-                },
-                {
-                    "id": str(paper_1.pk),
-                    "name": paper_1.name,
-                    "sort_order": paper_1.sort_order,
-                    "levels": [
-                        {
-                            "id": str(level_2.pk),
-                            "name": level_2.name,
-                            "deadlines": [
-                                {
-                                    "id": str(deadline_2.pk),
-                                    "full_name": deadline_2.full_name,
-                                },
-                            ],
-                        }
-                    ],
-                    "deadlines": [],  # if levels available do not display paper dealines
-                },
-            ],
-            cls=DjangoJSONEncoder,
-        )
+        assert response.data == [
+            {
+                "id": str(paper_4.pk),
+                "name": paper_4.name,
+                "sort_order": paper_4.sort_order,
+                "levels": [],  # if no levels specified show deadlines
+                "deadlines": [
+                    {
+                        "id": str(deadline_1.pk),
+                        "full_name": str(deadline_1.full_name),
+                    },
+                    {
+                        "id": str(deadline_3.pk),
+                        "full_name": str(deadline_3.full_name),
+                    },
+                ],
+            },
+            {
+                "id": str(paper_3.pk),
+                "name": paper_3.name,
+                "sort_order": paper_3.sort_order,
+                "levels": [
+                    {
+                        "id": str(level_1.pk),
+                        "name": level_1.name,
+                        "deadlines": [
+                            {
+                                "id": str(deadline_2.pk),
+                                "full_name": deadline_2.full_name,
+                            },
+                        ],
+                    }
+                ],
+                "deadlines": [],  # if levels available do not display paper deadlines
+            },
+            {
+                "id": str(paper_1.pk),
+                "name": paper_1.name,
+                "sort_order": paper_1.sort_order,
+                "levels": [
+                    {
+                        "id": str(level_2.pk),
+                        "name": level_2.name,
+                        "deadlines": [
+                            {
+                                "id": str(deadline_2.pk),
+                                "full_name": deadline_2.full_name,
+                            },
+                        ],
+                    }
+                ],
+                "deadlines": [],  # if levels available do not display paper dealines
+            },
+        ]
 
     def test_get_all_papers(
         self,
         use_tenant_connection,
         fast_tenant_client,
         create_papers,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """Returns all papers even the ones have no service"""
-        paper_1 = create_papers["paper_1"]
-        paper_2 = create_papers["paper_2"]
-        paper_3 = create_papers["paper_3"]
-        paper_4 = create_papers["paper_4"]
-        level_1 = create_papers["level_1"]
-        level_2 = create_papers["level_2"]
-        deadline_1 = create_papers["deadline_1"]
-        deadline_2 = create_papers["deadline_2"]
-        deadline_3 = create_papers["deadline_3"]
-
-        response = fast_tenant_client.get(reverse("paper-list"))
+        paper_1 = create_papers.paper_1
+        paper_2 = create_papers.paper_2
+        paper_3 = create_papers.paper_3
+        paper_4 = create_papers.paper_4
+        level_1 = create_papers.level_1
+        level_2 = create_papers.level_2
+        deadline_1 = create_papers.deadline_1
+        deadline_2 = create_papers.deadline_2
+        deadline_3 = create_papers.deadline_3
+
+        response = fast_tenant_client.get(cached_reverse("paper-list"))
 
         assert response.status_code == status.HTTP_200_OK
-        assert json.dumps(response.data, cls=DjangoJSONEncoder) == json.dumps(
-            [
-                {
-                    "id": str(paper_2.pk),
-                    "name": paper_2.name,
-                    "sort_order": paper_2.sort_order,
-                    "levels": [],
-                    "deadlines": [],
-                },
-                {
-                    "id": str(paper_4.pk),
-                    "name": paper_4.name,
-                    "sort_order": paper_4.sort_order,
-                    "levels": [],  # if no levels specified show deadlines
-                    "deadlines": [
-                        {
-                            "id": str(deadline_1.pk),
-                            "full_name": str(deadline_1.full_name),
-                        },
-                        {
-                            "id": str(deadline_3.pk),
-                            "full_name": str(deadline_3.full_name),
-                        },
-                    ],
-                },
-                {
-                    "id": str(paper_3.pk),
-                    "name": paper_3.name,
-                    "sort_order": paper_3.sort_order,
-                    "levels": [
-                        {
-                            "id": str(level_1.pk),
-                            "name": level_1.name,
-                            "deadlines": [
-                                {
-                                    "id": str(deadline_2.pk),
-                                    "full_name": deadline_2.full_name,
-                                },
-                            ],
-                        }
-                    ],
-                    "deadlines": [],  # if levels available do not display paper deadlines
-                },
-                {
-                    "id": str(paper_1.pk),
-                    "name": paper_1.name,
-                    "sort_order": paper_1.sort_order,
-                    "levels": [
-                        {
-                            "id": str(level_2.pk),
-                            "name": level_2.name,
-                            "deadlines": [
-                                {
-                                    "id": str(deadline_2.pk),
-                                    "full_name": deadline_2.full_name,
-                                },
-                            ],
-                        }
-                    ],
-                    "deadlines": [],  # if levels available do not display paper dealines
-                },
-            ],
-            cls=DjangoJSONEncoder,
-        )
+        assert response.data == [
+            {
+                "id": str(paper_2.pk),
+                "name": paper_2.name,
+                "sort_order": paper_2.sort_order,
+                "levels": [],
+                "deadlines": [],
+            },
+            {
+                "id": str(paper_4.pk),
+                "name": paper_4.name,
+                "sort_order": paper_4.sort_order,
+                "levels": [],  # if no levels specified show deadlines
+                "deadlines": [
+                    {
+                        "id": str(deadline_1.pk),
+                        "full_name": str(deadline_1.full_name),
+                    },
+                    {
+                        "id": str(deadline_3.pk),
+                        "full_name": str(deadline_3.full_name),
+                    },
+                ],
+            },
+            {
+                "id": str(paper_3.pk),
+                "name": paper_3.name,
+                "sort_order": paper_3.sort_order,
+                "levels": [
+                    {
+                        "id": str(level_1.pk),
+                        "name": level_1.name,
+                        "deadlines": [
+                            {
+                                "id": str(deadline_2.pk),
+                                "full_name": deadline_2.full_name,
+                            },
+                        ],
+                    }
+                ],
+                "deadlines": [],  # if levels available do not display paper deadlines
+            },
+            {
+                "id": str(paper_1.pk),
+                "name": paper_1.name,
+                "sort_order": paper_1.sort_order,
+                "levels": [
+                    {
+                        "id": str(level_2.pk),
+                        "name": level_2.name,
+                        "deadlines": [
+                            {
+                                "id": str(deadline_2.pk),
+                                "full_name": deadline_2.full_name,
+                            },
+                        ],
+                    }
+                ],
+                "deadlines": [],  # if levels available do not display paper dealines
+            },
+        ]
 
 
 @pytest.mark.django_db
@@ -1575,64 +1040,32 @@ class TestCreatePaper:
 
     valid_payload = {"name": "Admission Essay", "sort_order": 1}
 
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        response = fast_tenant_client.post(reverse("paper-list"), data={})
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_valid_payload(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        class_active_subscription,
     ):
         """Valid payload creates paper"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("paper-list"), data=TestCreatePaper.valid_payload
+        response = staff_client.post(
+            cached_reverse("paper-list"), data=TestCreatePaper.valid_payload
         )
         assert response.status_code == status.HTTP_201_CREATED
 
-    def test_non_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non-staff user is not allowed to create"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("paper-list"), data=TestCreatePaper.valid_payload
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
+    @pytest.mark.parametrize(
+        "payload",
+        [{"name": "", "sort_order": 1}, {"sort_order": 1}],
+        ids=["blank", "missing"],
+    )
     def test_name_required(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        payload,
+        class_active_subscription,
     ):
         """name is required"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("paper-list"), data={"name": "", "sort_order": 1}
-        )
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        response = fast_tenant_client.post(
-            reverse("paper-list"), data={"sort_order": 1}
-        )
+        response = staff_client.post(cached_reverse("paper-list"), data=payload)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
@@ -1640,90 +1073,43 @@ class TestCreatePaper:
 class TestUpdatePaper:
     """Tests for update paper"""
 
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        paper = Paper.objects.create(name="Thesis", sort_order=0)
-        response = fast_tenant_client.put(
-            reverse("paper-detail", kwargs={"pk": paper.pk}), data={}
-        )
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_valid_payload(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        class_active_subscription,
     ):
         """Updates successfully"""
         paper = Paper.objects.create(name="Thesis", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.put(
+        response = staff_client.put(
             reverse("paper-detail", kwargs={"pk": paper.pk}),
-            data=json.dumps(
-                {"name": "Mathematics", "sort_order": 7}, cls=DjangoJSONEncoder
-            ),
-            content_type="application/json",
+            data={"name": "Mathematics", "sort_order": 7},
+            format="json",
         )
         assert response.status_code == status.HTTP_200_OK
         paper.refresh_from_db()
         assert paper.name == "Mathematics"
         assert paper.sort_order == 7
 
-    def test_only_staff(
-        self,
-        use_tenant_connection,
-        fast_tenant_client,
-        customer,
-        create_active_subscription,
-    ):
-        """Non-staff users cannot update"""
-        paper = Paper.objects.create(name="Business", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("paper-detail", kwargs={"pk": paper.pk}),
-            data=json.dumps(
-                {"name": "Mathematics", "sort_order": 7}, cls=DjangoJSONEncoder
-            ),
-            content_type="application/json",
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
+    @pytest.mark.parametrize(
+        "payload",
+        [{"name": "", "sort_order": 7}, {"sort_order": 7}],
+        ids=["blank", "missing"],
+    )
     def test_name_required(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        payload,
+        class_active_subscription,
     ):
         """name is required"""
         paper = Paper.objects.create(name="Business", sort_order=0)
-
-        # blank is not allowed
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.put(
-            reverse("paper-detail", kwargs={"pk": paper.pk}),
-            data=json.dumps({"name": "", "sort_order": 7}, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-        # none is not allowed
-        response = fast_tenant_client.put(
+        response = staff_client.put(
             reverse("paper-detail", kwargs={"pk": paper.pk}),
-            data=json.dumps({"sort_order": 7}, cls=DjangoJSONEncoder),
-            content_type="application/json",
+            data=payload,
+            format="json",
         )
-
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
@@ -1731,264 +1117,391 @@ class TestUpdatePaper:
 class TestDeletePaper:
     """Tests for delete paper"""
 
-    def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
-    ):
-        """Authentication is required"""
-        paper = Paper.objects.create(name="Thesis", sort_order=0)
-
-        response = fast_tenant_client.delete(
-            reverse("paper-detail", kwargs={"pk": paper.pk})
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_valid_paper(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
-        create_active_subscription,
+        staff_client,
+        class_active_subscription,
     ):
         """Deletes paper"""
         paper = Paper.objects.create(name="Thesis", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("paper-detail", kwargs={"pk": paper.pk})
-        )
+        response = staff_client.delete(reverse("paper-detail", kwargs={"pk": paper.pk}))
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert Paper.objects.filter(name="Thesis").count() == 0
+        assert not Paper.objects.filter(pk=paper.pk).exists()
 
+
+@pytest.mark.django_db
+class TestDeadlineAndPaperPermissions:
+    """Tests for authentication and staff permissions on deadlines and papers"""
+
+    @pytest.mark.parametrize(
+        "method,url_name,pk_required",
+        [
+            ("post", "deadline-list", False),
+            ("put", "deadline-detail", True),
+            ("delete", "deadline-detail", True),
+            ("post", "paper-list", False),
+            ("put", "paper-detail", True),
+            ("delete", "paper-detail", True),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "authenticated,status_code",
+        [
+            (False, status.HTTP_401_UNAUTHORIZED),
+            (True, status.HTTP_403_FORBIDDEN),
+        ],
+    )
     def test_only_staff(
         self,
         use_tenant_connection,
         fast_tenant_client,
-        customer,
-        create_active_subscription,
+        customer_token,
+        dummy_uuid,
+        method,
+        url_name,
+        pk_required,
+        authenticated,
+        status_code,
+        class_active_subscription,
     ):
-        """Non-staff users cannot delete"""
-        paper = Paper.objects.create(name="Thesis", sort_order=0)
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
-        )
-        response = fast_tenant_client.delete(
-            reverse("paper-detail", kwargs={"pk": paper.pk})
-        )
-        assert response.status_code == status.HTTP_403_FORBIDDEN
+        """Authentication is required and non-staff users are not allowed"""
+        if authenticated:
+            fast_tenant_client.cookies["access_token"] = customer_token
+
+        if pk_required:
+            url = reverse(url_name, kwargs={"pk": dummy_uuid})
+        else:
+            url = cached_reverse(url_name)
+
+        response = getattr(fast_tenant_client, method)(url)
+        assert response.status_code == status_code
 
 
-class CalculatePriceTestCase(FastTenantTestCase):
+@pytest.mark.django_db
+class TestCalculatePrice:
     """Tests for price calculation"""
 
-    def setUp(self):
-        super().setUp()
-        self.client = TenantClient(self.tenant)
-        # create active subscription
-        Subscription.objects.create(
-            is_on_trial=False,
-            status=Subscription.Status.ACTIVE,
-            start_time=dateutil.parser.parse(
-                "2016-01-01T00:20:49Z",
-            ),
-            next_billing_time=dateutil.parser.parse(
-                "2016-05-01T00:20:49Z",
-            ),
-        )
-        self.level = Level.objects.create(name="TestLevel")
-        self.deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY
-        )
-        self.paper = Paper.objects.create(name="TestPaper")
-        self.writer_type = WriterType.objects.create(name="Premium")
-        self.valid_payload = {
-            "level": self.level.id,
-            "deadline": self.deadline.id,
+    @pytest.fixture(scope="class")
+    def create_calculator(self, class_tenant_db):
+        """Level, deadline, paper and writer type used by the calculator"""
+        with class_tenant_db() as created:
+            level = Level.objects.create(name="TestLevel")
+            deadline = Deadline.objects.create(
+                value=1, deadline_type=Deadline.DeadlineType.DAY
+            )
+            paper = Paper.objects.create(name="TestPaper")
+            writer_type = WriterType.objects.create(name="Premium")
+            created += [level, deadline, paper, writer_type]
+
+        return SimpleNamespace(
+            level=level, deadline=deadline, paper=paper, writer_type=writer_type
+        )
+
+    @pytest.fixture(scope="class")
+    def valid_payload(self, create_calculator):
+        return {
+            "level": create_calculator.level.id,
+            "deadline": create_calculator.deadline.id,
             "pages": 3,
-            "writer_type": self.writer_type.id,
-            "paper": self.paper.id,
+            "writer_type": create_calculator.writer_type.id,
+            "paper": create_calculator.paper.id,
         }
-        self.user = User.objects.create_user(
-            username="testuser",
-            first_name="Test",
-            email="testuser@testdomain.com",
-            password="12345",
-        )
 
-    def post(self, payload):
+    @pytest.fixture
+    def post(self, fast_tenant_api_client):
         """Method POST"""
 
-        return self.client.post(
-            reverse("calculator"),
-            data=json.dumps(payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
+        def post(payload):
+            return fast_tenant_api_client.post(
+                cached_reverse("calculator"), payload, format="json"
+            )
 
-    def test_valid_payload(self):
+        return post
+
+    @pytest.fixture
+    def freeze_now(self):
+        """Fix the current time that coupon expiry is checked against"""
+        with mock.patch("django.utils.timezone.now", mock.Mock(return_value=NOW)):
+            yield
+
+    def test_valid_payload(
+        self,
+        use_tenant_connection,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
         """Confirm calculation for valid payload is correct"""
         service = Service.objects.create(
-            level=self.level, deadline=self.deadline, paper=self.paper, amount=15.00
+            level=create_calculator.level,
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=15.00,
         )
         WriterTypeService.objects.create(
-            writer_type=self.writer_type, service=service, amount=5.00
-        )
-        response = self.post(self.valid_payload)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "60.00",
-                "total": "60.00",
-                "coupon_code": None,
-            },
+            writer_type=create_calculator.writer_type, service=service, amount=5.00
         )
+        response = post(valid_payload)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "subtotal": "60.00",
+            "total": "60.00",
+            "coupon_code": None,
+        }
 
-    def test_level_optional(self):
+    def test_level_optional(
+        self,
+        use_tenant_connection,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
         """Ensure `level` is optional"""
         # A service with no level specified
         service = Service.objects.create(
-            deadline=self.deadline, paper=self.paper, amount=15.00
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=15.00,
         )
         WriterTypeService.objects.create(
-            writer_type=self.writer_type, service=service, amount=5.00
-        )
-        payload = {**self.valid_payload, "level": ""}
-        response = self.post(payload)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "60.00",
-                "total": "60.00",
-                "coupon_code": None,
-            },
+            writer_type=create_calculator.writer_type, service=service, amount=5.00
         )
+        response = post({**valid_payload, "level": ""})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "subtotal": "60.00",
+            "total": "60.00",
+            "coupon_code": None,
+        }
 
-    def test_deadline_required(self):
+    def test_deadline_required(
+        self, use_tenant_connection, post, valid_payload, class_active_subscription
+    ):
         """Ensure `deadline` is provided in the request payload"""
-        payload = {**self.valid_payload, "deadline": ""}
-        response = self.post(payload)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = post({**valid_payload, "deadline": ""})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_pages_required(self):
+    def test_pages_required(
+        self, use_tenant_connection, post, valid_payload, class_active_subscription
+    ):
         """Ensure `pages` is provided in the request payload"""
-        payload = {**self.valid_payload, "pages": ""}
-        response = self.post(payload)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = post({**valid_payload, "pages": ""})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_writer_type_optional(self):
+    def test_writer_type_optional(
+        self,
+        use_tenant_connection,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
         """Ensure `writer_type` can be optional"""
         Service.objects.create(
-            level=self.level, deadline=self.deadline, paper=self.paper, amount=15.00
+            level=create_calculator.level,
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=15.00,
         )
-        payload = {**self.valid_payload, "writer_type": ""}
-        response = self.post(payload)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = post({**valid_payload, "writer_type": ""})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "subtotal": "45.00",
+            "total": "45.00",
+            "coupon_code": None,
+        }
 
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "45.00",
-                "total": "45.00",
-                "coupon_code": None,
-            },
+    def test_service_priority(
+        self,
+        use_tenant_connection,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
+        """Ensure a service with no level is given priority first"""
+        Service.objects.create(
+            level=create_calculator.level,
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=15.00,
+        )
+        Service.objects.create(
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=12.00,
         )
+        response = post({**valid_payload, "writer_type": ""})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            "subtotal": "36.00",
+            "total": "36.00",
+            "coupon_code": None,
+        }
 
-    def test_service_priority(self):
-        """Ensure a service with no level is given priority first"""
+    def test_writer_type_service_priority(
+        self,
+        use_tenant_connection,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
+        """Ensure the writer type price of a service with no level is used"""
+        # Only the service for the level is priced for the writer type
+        service = Service.objects.create(
+            level=create_calculator.level,
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=15.00,
+        )
+        WriterTypeService.objects.create(
+            writer_type=create_calculator.writer_type, service=service, amount=5.00
+        )
         Service.objects.create(
-            level=self.level, deadline=self.deadline, paper=self.paper, amount=15.00
-        )
-        Service.objects.create(deadline=self.deadline, paper=self.paper, amount=12.00)
-        payload = {**self.valid_payload, "writer_type": ""}
-        response = self.post(payload)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "36.00",
-                "total": "36.00",
-                "coupon_code": None,
-            },
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=12.00,
         )
+        response = post(valid_payload)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_writer_type_availability(self):
+    def test_writer_type_availability(
+        self,
+        use_tenant_connection,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
         """Ensure provided `writer_type` is available for service"""
         # Service exists but writer type price not set
         Service.objects.create(
-            level=self.level, deadline=self.deadline, paper=self.paper, amount=15.00
+            level=create_calculator.level,
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=15.00,
         )
-        response = self.post(self.valid_payload)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = post(valid_payload)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_service_availability(self):
+    @pytest.mark.parametrize(
+        "model,kwargs",
+        [
+            pytest.param(None, None, id="missing"),
+            pytest.param(
+                Deadline,
+                {"value": 2, "deadline_type": Deadline.DeadlineType.DAY},
+                id="other_deadline",
+            ),
+            pytest.param(Level, {"name": "High School"}, id="other_level"),
+            pytest.param(Paper, {"name": "Admission Essay"}, id="other_paper"),
+        ],
+    )
+    def test_service_availability(
+        self,
+        use_tenant_connection,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+        model,
+        kwargs,
+    ):
         """Ensure an appropriate message is returned if service does not exist"""
-        # no service exists for posted deadline, level and paper
-        response = self.post({**self.valid_payload, "writer_type": ""})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        if model:
+            # A service exists, but for another deadline, level or paper
+            fields = {
+                "level": create_calculator.level,
+                "deadline": create_calculator.deadline,
+                "paper": create_calculator.paper,
+            }
+            fields[model._meta.model_name] = model.objects.create(**kwargs)
+            Service.objects.create(**fields, amount=15.00)
+
+        response = post({**valid_payload, "writer_type": ""})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-        # no service exists with posted deadline
-        deadline = Deadline.objects.create(
-            value=2, deadline_type=Deadline.DeadlineType.DAY
-        )
+    @pytest.mark.parametrize(
+        "pages,status_code",
+        [
+            (0, status.HTTP_400_BAD_REQUEST),
+            (1, status.HTTP_200_OK),
+            (1000, status.HTTP_200_OK),
+            (1001, status.HTTP_400_BAD_REQUEST),
+        ],
+    )
+    def test_pages_range(
+        self,
+        use_tenant_connection,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+        pages,
+        status_code,
+    ):
+        """Ensure `pages` is between 1 and 1000"""
         Service.objects.create(
-            deadline=deadline, level=self.level, paper=self.paper, amount=15.00
+            level=create_calculator.level,
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=15.00,
         )
-        response = self.post({**self.valid_payload, "writer_type": ""})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = post({**valid_payload, "pages": pages, "writer_type": ""})
+        assert response.status_code == status_code
 
-        # no service exists for posted level
-        Service.objects.all().delete()
-        level = Level.objects.create(name="High School")
-        Service.objects.create(
-            level=level, deadline=self.deadline, paper=self.paper, amount=15.00
+    def test_num_queries(
+        self,
+        use_tenant_connection,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
+        """Ensure the writer type price is fetched together with the service"""
+        service = Service.objects.create(
+            deadline=create_calculator.deadline,
+            paper=create_calculator.paper,
+            amount=15.00,
         )
-        response = self.post({**self.valid_payload, "writer_type": ""})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-        # no service exists for posted paper
-        Service.objects.all().delete()
-        paper = Paper.objects.create(name="Admission Essay")
-        Service.objects.create(
-            paper=paper, level=self.level, deadline=self.deadline, amount=15.00
+        WriterTypeService.objects.create(
+            writer_type=create_calculator.writer_type, service=service, amount=5.00
         )
-        response = self.post({**self.valid_payload, "writer_type": ""})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-    def test_pages_min(self):
-        """Ensure `pages` min value is 1"""
-        Service.objects.create(
-            level=self.level, deadline=self.deadline, paper=self.paper, amount=15.00
-        )
-        payload = {**self.valid_payload, "pages": 0, "writer_type": ""}
-        response = self.post(payload)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        with CaptureQueriesContext(connection) as without_writer_type:
+            response = post({**valid_payload, "writer_type": ""})
 
-        payload = {**self.valid_payload, "pages": 1, "writer_type": ""}
-        response = self.post(payload)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        assert response.status_code == status.HTTP_200_OK
 
-    def test_pages_max(self):
-        """Ensure `pages` max value is 1000"""
-        Service.objects.create(
-            level=self.level, deadline=self.deadline, paper=self.paper, amount=15.00
-        )
-        payload = {**self.valid_payload, "pages": 1001, "writer_type": ""}
-        response = self.post(payload)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        with CaptureQueriesContext(connection) as with_writer_type:
+            response = post(valid_payload)
 
-        payload = {**self.valid_payload, "pages": 1000, "writer_type": ""}
-        response = self.post(payload)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        assert response.status_code == status.HTTP_200_OK
+        # Only the writer type itself is looked up on top
+        assert len(with_writer_type) == len(without_writer_type) + 1
 
-    def test_discount_anonymous_user(self):
+    def test_discount_anonymous_user(
+        self,
+        use_tenant_connection,
+        freeze_now,
+        post,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
         """Ensure correct discount is given if user is anonymous"""
         Service.objects.create(
-            deadline=self.deadline, level=self.level, paper=self.paper, amount=15
+            deadline=create_calculator.deadline,
+            level=create_calculator.level,
+            paper=create_calculator.paper,
+            amount=15,
         )
-        start_date = timezone.now()
+        start_date = NOW
         end_date = start_date + timedelta(days=1)
 
         # First Timer coupon
@@ -2007,23 +1520,34 @@ class CalculatePriceTestCase(FastTenantTestCase):
             start_date=start_date,
             end_date=end_date,
         )
-        response = self.post({**self.valid_payload, "writer_type": ""})
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "45.00",
-                "total": "36.00",
-                "coupon_code": "MCEFirst",
-            },
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = post({**valid_payload, "writer_type": ""})
+        assert response.data == {
+            "subtotal": "45.00",
+            "total": "36.00",
+            "coupon_code": "MCEFirst",
+        }
+        assert response.status_code == status.HTTP_200_OK
 
-    def test_discount_authenticated_user(self):
+    def test_discount_authenticated_user(
+        self,
+        use_tenant_connection,
+        freeze_now,
+        fast_tenant_api_client,
+        post,
+        customer,
+        customer_token,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
         """Ensure correct discount if user is authenticated"""
         service = Service.objects.create(
-            deadline=self.deadline, level=self.level, paper=self.paper, amount=15
+            deadline=create_calculator.deadline,
+            level=create_calculator.level,
+            paper=create_calculator.paper,
+            amount=15,
         )
-        start_date = timezone.now()
+        start_date = NOW
         end_date = start_date + timedelta(days=1)
 
         # First Timer coupon
@@ -2044,86 +1568,50 @@ class CalculatePriceTestCase(FastTenantTestCase):
         )
 
         # First timer coupon is applied if user is first timer
-        payload = {**self.valid_payload, "writer_type": ""}
-        self.client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(self.user).access_token}
-        )
-        response = self.client.post(
-            reverse("calculator"),
-            data=json.dumps(payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "45.00",
-                "total": "36.00",
-                "coupon_code": "MCEFirst",
-            },
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        payload = {**valid_payload, "writer_type": ""}
+        fast_tenant_api_client.cookies["access_token"] = customer_token
+        response = post(payload)
+        assert response.data == {
+            "subtotal": "45.00",
+            "total": "36.00",
+            "coupon_code": "MCEFirst",
+        }
+        assert response.status_code == status.HTTP_200_OK
 
         # Test if user is not first timer
         #  Min price coupon is applied if user is not first timer
-        Order.objects.create(owner=self.user, status=Order.Status.PAID)
-        response = self.client.post(
-            reverse("calculator"),
-            data=json.dumps(payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "45.00",
-                "total": "40.50",
-                "coupon_code": "MCE20",
-            },
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        Order.objects.create(owner=customer, status=Order.Status.PAID)
+        response = post(payload)
+        assert response.data == {
+            "subtotal": "45.00",
+            "total": "40.50",
+            "coupon_code": "MCE20",
+        }
+        assert response.status_code == status.HTTP_200_OK
 
         # Min coupon is applied if amount payable is exactly equal to coupon min amount
-        min_price_coupon.minimum = 45.00
-        min_price_coupon.save()
-        min_price_coupon.refresh_from_db()
-        self.assertEqual(
-            min_price_coupon.minimum, service.amount * self.valid_payload["pages"]
-        )
-        response = self.client.post(
-            reverse("calculator"),
-            data=json.dumps(payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "45.00",
-                "total": "40.50",
-                "coupon_code": "MCE20",
-            },
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        Coupon.objects.filter(pk=min_price_coupon.pk).update(
+            minimum=service.amount * valid_payload["pages"]
+        )
+        response = post(payload)
+        assert response.data == {
+            "subtotal": "45.00",
+            "total": "40.50",
+            "coupon_code": "MCE20",
+        }
+        assert response.status_code == status.HTTP_200_OK
 
         # Min coupon is not applied if amount payable is less than coupon min amount
-        min_price_coupon.minimum = 46.00
-        min_price_coupon.save()
-        min_price_coupon.refresh_from_db()
-        self.assertGreater(
-            min_price_coupon.minimum, service.amount * self.valid_payload["pages"]
-        )
-        response = self.client.post(
-            reverse("calculator"),
-            data=json.dumps(payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "45.00",
-                "total": "45.00",
-                "coupon_code": None,
-            },
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        Coupon.objects.filter(pk=min_price_coupon.pk).update(
+            minimum=service.amount * valid_payload["pages"] + 1
+        )
+        response = post(payload)
+        assert response.data == {
+            "subtotal": "45.00",
+            "total": "45.00",
+            "coupon_code": None,
+        }
+        assert response.status_code == status.HTTP_200_OK
 
         # The first coupon with the largest minimum value is applied if coupons multiple
         Coupon.objects.create(
@@ -2133,193 +1621,245 @@ class CalculatePriceTestCase(FastTenantTestCase):
             start_date=start_date,
             end_date=end_date,
         )
-        response = self.client.post(
-            reverse("calculator"),
-            data=json.dumps(payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "45.00",
-                "total": "42.75",
-                "coupon_code": "MCE5",
-            },
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = post(payload)
+        assert response.data == {
+            "subtotal": "45.00",
+            "total": "42.75",
+            "coupon_code": "MCE5",
+        }
+        assert response.status_code == status.HTTP_200_OK
 
-    def test_discount_coupon_expiry(self):
+    def test_discount_coupon_expiry(
+        self,
+        use_tenant_connection,
+        freeze_now,
+        post,
+        customer,
+        create_calculator,
+        valid_payload,
+        class_active_subscription,
+    ):
         """Ensure discount is not applied if coupon expired"""
         Service.objects.create(
-            deadline=self.deadline, level=self.level, paper=self.paper, amount=15
+            deadline=create_calculator.deadline,
+            level=create_calculator.level,
+            paper=create_calculator.paper,
+            amount=15,
         )
 
         # Ensure first timer expired coupon is not applied
         Coupon.objects.create(
             code="MCEFirst",
             percent_off=20,
-            start_date=timezone.now() - timedelta(days=3),
-            end_date=timezone.now() - timedelta(days=1),
+            start_date=NOW - timedelta(days=3),
+            end_date=NOW - timedelta(days=1),
             coupon_type=Coupon.CouponType.FIRST_TIMER,
         )
-        response = self.post({**self.valid_payload, "writer_type": ""})
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "45.00",
-                "total": "45.00",
-                "coupon_code": None,
-            },
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = post({**valid_payload, "writer_type": ""})
+        assert response.data == {
+            "subtotal": "45.00",
+            "total": "45.00",
+            "coupon_code": None,
+        }
+        assert response.status_code == status.HTTP_200_OK
 
         # Ensure min price expired coupon is not applied for non first timer
-        Order.objects.create(owner=self.user, status=Order.Status.PAID)
+        Order.objects.create(owner=customer, status=Order.Status.PAID)
         Coupon.objects.create(
             code="Expired",
             percent_off=10,
             minimum=20.00,
-            start_date=timezone.now() - timedelta(days=3),
-            end_date=timezone.now() - timedelta(days=1),
-        )
-        response = self.post({**self.valid_payload, "writer_type": ""})
-        self.assertEqual(
-            response.data,
-            {
-                "subtotal": "45.00",
-                "total": "45.00",
-                "coupon_code": None,
-            },
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+            start_date=NOW - timedelta(days=3),
+            end_date=NOW - timedelta(days=1),
+        )
+        response = post({**valid_payload, "writer_type": ""})
+        assert response.data == {
+            "subtotal": "45.00",
+            "total": "45.00",
+            "coupon_code": None,
+        }
+        assert response.status_code == status.HTTP_200_OK
 
 
-class WriterTypeServiceTestCase(FastTenantTestCase):
+@pytest.mark.django_db
+class TestWriterTypeService:
     """Tests for GET writer type service"""
 
-    def setUp(self):
-        super().setUp()
-        self.client = TenantClient(self.tenant)
-        # create active subscription
-        Subscription.objects.create(
-            is_on_trial=False,
-            status=Subscription.Status.ACTIVE,
-            start_time=dateutil.parser.parse(
-                "2016-01-01T00:20:49Z",
-            ),
-            next_billing_time=dateutil.parser.parse(
-                "2016-05-01T00:20:49Z",
-            ),
-        )
-        level = Level.objects.create(name="TestLevel")
-        deadline = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY
-        )
-        paper = Paper.objects.create(name="TestPaper")
-        self.service = Service.objects.create(
-            level=level, deadline=deadline, paper=paper, amount=15.00
-        )
-        self.writer_type_1 = WriterType.objects.create(
-            name="Top", sort_order=1, description="Awesome description"
-        )
-        self.writer_type_2 = WriterType.objects.create(name="Premium", sort_order=2)
-        WriterTypeService.objects.create(
-            writer_type=self.writer_type_1, service=self.service, amount=5.00
-        )
-        WriterTypeService.objects.create(
-            writer_type=self.writer_type_2, service=self.service, amount=8.00
-        )
-        tag_1 = WriterTypeTag.objects.create(title="Popular")
-        self.writer_type_1.tags.add(tag_1)
-
-        self.valid_payload = {
-            "level": level.pk,
-            "deadline": deadline.pk,
-            "paper": paper.pk,
+    @pytest.fixture(scope="class")
+    def create_writer_types(self, class_tenant_db):
+        """Service priced for two writer types, the first one tagged"""
+        with class_tenant_db() as created:
+            level = Level.objects.create(name="TestLevel")
+            deadline = Deadline.objects.create(
+                value=1, deadline_type=Deadline.DeadlineType.DAY
+            )
+            paper = Paper.objects.create(name="TestPaper")
+            service = Service.objects.create(
+                level=level, deadline=deadline, paper=paper, amount=15.00
+            )
+            writer_type_1 = WriterType.objects.create(
+                name="Top", sort_order=1, description="Awesome description"
+            )
+            writer_type_2 = WriterType.objects.create(name="Premium", sort_order=2)
+            writer_type_services = WriterTypeService.objects.bulk_create(
+                [
+                    WriterTypeService(
+                        writer_type=writer_type_1, service=service, amount=5.00
+                    ),
+                    WriterTypeService(
+                        writer_type=writer_type_2, service=service, amount=8.00
+                    ),
+                ]
+            )
+            tag_1 = WriterTypeTag.objects.create(title="Popular")
+            writer_type_1.tags.add(tag_1)
+            created += [
+                level,
+                deadline,
+                paper,
+                service,
+                writer_type_1,
+                writer_type_2,
+                *writer_type_services,
+                tag_1,
+            ]
+
+        return SimpleNamespace(
+            level=level,
+            deadline=deadline,
+            paper=paper,
+            writer_type_1=writer_type_1,
+            writer_type_2=writer_type_2,
+        )
+
+    @pytest.fixture(scope="class")
+    def valid_payload(self, create_writer_types):
+        return {
+            "level": create_writer_types.level.pk,
+            "deadline": create_writer_types.deadline.pk,
+            "paper": create_writer_types.paper.pk,
         }
-        self.maxDiff = None
 
-    def post(self, payload):
+    @pytest.fixture
+    def post(self, fast_tenant_api_client):
         """Method POST"""
-        return self.client.post(
-            reverse("writer_type"),
-            data=json.dumps(payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
-        )
 
-    def test_valid_payload(self):
+        def post(payload):
+            return fast_tenant_api_client.post(
+                cached_reverse("writer_type"), payload, format="json"
+            )
+
+        return post
+
+    def test_valid_payload(
+        self,
+        use_tenant_connection,
+        post,
+        create_writer_types,
+        valid_payload,
+        class_active_subscription,
+    ):
         """Ensure returns writer types for valid payload"""
-        response = self.post(self.valid_payload)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(
-            json.dumps(response.data, cls=DjangoJSONEncoder),
-            json.dumps(
-                [
-                    {
-                        "writer_type": {
-                            "id": str(self.writer_type_1.pk),
-                            "name": self.writer_type_1.name,
-                            "description": self.writer_type_1.description,
-                            "tags": ["Popular"],
-                        },
-                        "amount": "5.00",
-                    },
-                    {
-                        "writer_type": {
-                            "id": str(self.writer_type_2.pk),
-                            "name": self.writer_type_2.name,
-                            "description": self.writer_type_2.description,
-                            "tags": [],
-                        },
-                        "amount": "8.00",
-                    },
-                ],
-                cls=DjangoJSONEncoder,
-            ),
+        writer_type_1 = create_writer_types.writer_type_1
+        writer_type_2 = create_writer_types.writer_type_2
+        response = post(valid_payload)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {
+                "writer_type": {
+                    "id": str(writer_type_1.pk),
+                    "name": writer_type_1.name,
+                    "description": writer_type_1.description,
+                    "tags": ["Popular"],
+                },
+                "amount": "5.00",
+            },
+            {
+                "writer_type": {
+                    "id": str(writer_type_2.pk),
+                    "name": writer_type_2.name,
+                    "description": writer_type_2.description,
+                    "tags": [],
+                },
+                "amount": "8.00",
+            },
+        ]
+
+    def test_num_queries(
+        self,
+        use_tenant_connection,
+        post,
+        create_writer_types,
+        valid_payload,
+        class_active_subscription,
+    ):
+        """Ensure the number of queries does not grow with the writer types"""
+        with CaptureQueriesContext(connection) as two_writer_types:
+            response = post(valid_payload)
+
+        assert len(response.data) == 2
+
+        service = Service.objects.get(
+            level=create_writer_types.level,
+            deadline=create_writer_types.deadline,
+            paper=create_writer_types.paper,
+        )
+        writer_type = WriterType.objects.create(name="Standard", sort_order=3)
+        writer_type.tags.add(WriterTypeTag.objects.create(title="Affordable"))
+        WriterTypeService.objects.create(
+            writer_type=writer_type, service=service, amount=3.00
         )
 
-    def test_no_writer_types(self):
+        with CaptureQueriesContext(connection) as three_writer_types:
+            response = post(valid_payload)
+
+        assert len(response.data) == 3
+        assert len(three_writer_types) == len(two_writer_types)
+
+    def test_no_writer_types(
+        self,
+        use_tenant_connection,
+        post,
+        create_writer_types,
+        class_active_subscription,
+    ):
         """Ensure the response is correct if no writer types available"""
         level = Level.objects.create(name="High School")
         deadline = Deadline.objects.create(
             value=2, deadline_type=Deadline.DeadlineType.DAY
         )
         paper = Paper.objects.create(name="Argumentative Essay")
-        response = self.post(
-            {"level": level.pk, "deadline": deadline.pk, "paper": paper.pk}
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
+        response = post({"level": level.pk, "deadline": deadline.pk, "paper": paper.pk})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == []
 
-    def test_invalid_level(self):
+    def test_invalid_level(
+        self, use_tenant_connection, post, valid_payload, class_active_subscription
+    ):
         """Ensure a validation error is raised if level invalid"""
-        response = self.post({**self.valid_payload, "level": "871"})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_invalid_deadline(self):
-        """Ensure a validation error is raised if deadline invalid"""
-        response = self.post({**self.valid_payload, "deadline": "871"})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-
-    def test_invalid_paper(self):
-        """Ensure a validation error is raised if paper invalid"""
-        response = self.post({**self.valid_payload, "paper": "871"})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = post({**valid_payload, "level": "871"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_level_optional(self):
+    def test_level_optional(
+        self, use_tenant_connection, post, valid_payload, class_active_subscription
+    ):
         """Ensure level is optional"""
-        response = self.post({**self.valid_payload, "level": ""})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = post({**valid_payload, "level": ""})
+        assert response.status_code == status.HTTP_200_OK
 
-    def test_deadline_required(self):
+    def test_deadline_required(
+        self, use_tenant_connection, post, valid_payload, class_active_subscription
+    ):
         """Ensure deadline is required"""
-        response = self.post({**self.valid_payload, "deadline": ""})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = post({**valid_payload, "deadline": ""})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_paper_required(self):
+    def test_paper_required(
+        self, use_tenant_connection, post, valid_payload, class_active_subscription
+    ):
         """Ensure paper is required"""
-        response = self.post({**self.valid_payload, "paper": ""})
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = post({**valid_payload, "paper": ""})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
 @pytest.mark.django_db
@@ -2328,62 +1868,62 @@ class TestCreatePrices:
 
     @pytest.fixture()
     def set_up(self):
-        paper_1 = Paper.objects.create(name="Case Study")
-        level_1 = Level.objects.create(name="High School")
-        level_2 = Level.objects.create(name="College")
-        deadline_1 = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY
+        level_1, level_2 = Level.objects.bulk_create(
+            [Level(name="High School"), Level(name="College")]
         )
-        deadline_2 = Deadline.objects.create(
-            value=2, deadline_type=Deadline.DeadlineType.DAY
-        )
-        deadline_3 = Deadline.objects.create(
-            value=3, deadline_type=Deadline.DeadlineType.DAY
-        )
-        deadline_4 = Deadline.objects.create(
-            value=4, deadline_type=Deadline.DeadlineType.DAY
+        deadline_1, deadline_2, deadline_3, deadline_4 = Deadline.objects.bulk_create(
+            [
+                Deadline(value=value, deadline_type=Deadline.DeadlineType.DAY)
+                for value in range(1, 5)
+            ]
         )
 
-        return locals()
+        return SimpleNamespace(
+            paper_1=Paper.objects.create(name="Case Study"),
+            level_1=level_1,
+            level_2=level_2,
+            deadline_1=deadline_1,
+            deadline_2=deadline_2,
+            deadline_3=deadline_3,
+            deadline_4=deadline_4,
+        )
 
     def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
+        self, use_tenant_connection, fast_tenant_client, class_active_subscription
     ):
         """Authentication is required"""
-        response = fast_tenant_client.post(reverse("service-create-bulk"), data={})
+        response = fast_tenant_client.post(
+            cached_reverse("service-create-bulk"), data={}
+        )
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_only_staff(
         self,
         use_tenant_connection,
         fast_tenant_client,
-        customer,
-        create_active_subscription,
+        customer_token,
+        class_active_subscription,
     ):
         """Non-staff is not allowed to create prices"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
+        fast_tenant_client.cookies["access_token"] = customer_token
+        response = fast_tenant_client.post(
+            cached_reverse("service-create-bulk"), data={}
         )
-        response = fast_tenant_client.post(reverse("service-create-bulk"), data={})
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_staff(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
+        staff_client,
         set_up,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """Staff can create prices"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        paper_1 = set_up["paper_1"]
-        level_1 = set_up["level_1"]
-        deadline_1 = set_up["deadline_1"]
-        deadline_2 = set_up["deadline_2"]
-        deadline_3 = set_up["deadline_3"]
+        paper_1 = set_up.paper_1
+        level_1 = set_up.level_1
+        deadline_1 = set_up.deadline_1
+        deadline_2 = set_up.deadline_2
+        deadline_3 = set_up.deadline_3
         valid_payload = {
             "paper_id": str(paper_1.id),
             "prices": [
@@ -2404,10 +1944,8 @@ class TestCreatePrices:
                 },
             ],
         }
-        response = fast_tenant_client.post(
-            reverse("service-create-bulk"),
-            data=json.dumps(valid_payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
+        response = staff_client.post(
+            cached_reverse("service-create-bulk"), valid_payload, format="json"
         )
         assert response.status_code == status.HTTP_201_CREATED
         assert Service.objects.filter(paper__id=paper_1.id).count() == 3
@@ -2415,19 +1953,15 @@ class TestCreatePrices:
     def test_level_optional(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
+        staff_client,
         set_up,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """Level is optional"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        paper_1 = set_up["paper_1"]
-        deadline_1 = set_up["deadline_1"]
-        deadline_2 = set_up["deadline_2"]
-        deadline_3 = set_up["deadline_3"]
+        paper_1 = set_up.paper_1
+        deadline_1 = set_up.deadline_1
+        deadline_2 = set_up.deadline_2
+        deadline_3 = set_up.deadline_3
         valid_payload = {
             "paper_id": str(paper_1.id),
             "prices": [
@@ -2448,46 +1982,35 @@ class TestCreatePrices:
                 },
             ],
         }
-        response = fast_tenant_client.post(
-            reverse("service-create-bulk"),
-            data=json.dumps(valid_payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
+        response = staff_client.post(
+            cached_reverse("service-create-bulk"), valid_payload, format="json"
         )
         assert response.status_code == status.HTTP_201_CREATED
         assert Service.objects.filter(paper__id=paper_1.id).count() == 3
 
-    def discards_existing_records(
+    def test_discards_existing_records(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
+        staff_client,
         set_up,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """Any existing records are discarded"""
-        paper_1 = set_up["paper_1"]
-        level_1 = set_up["level_1"]
-        level_2 = set_up["level_2"]
-        deadline_1 = set_up["deadline_1"]
-        deadline_2 = set_up["deadline_2"]
-        deadline_3 = set_up["deadline_3"]
-        deadline_4 = set_up["deadline_4"]
-
-        Service.objects.create(
-            level=level_1, paper=paper_1, deadline=deadline_1, amount=1
-        )
-        Service.objects.create(
-            level=level_1, paper=paper_1, deadline=deadline_2, amount=1
-        )
-        Service.objects.create(
-            level=level_1, paper=paper_1, deadline=deadline_3, amount=1
-        )
-        Service.objects.create(
-            level=level_2, paper=paper_1, deadline=deadline_4, amount=1
-        )
-
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
+        paper_1 = set_up.paper_1
+        level_1 = set_up.level_1
+        level_2 = set_up.level_2
+        deadline_1 = set_up.deadline_1
+        deadline_2 = set_up.deadline_2
+        deadline_3 = set_up.deadline_3
+        deadline_4 = set_up.deadline_4
+
+        Service.objects.bulk_create(
+            [
+                Service(level=level_1, paper=paper_1, deadline=deadline_1, amount=1),
+                Service(level=level_1, paper=paper_1, deadline=deadline_2, amount=1),
+                Service(level=level_1, paper=paper_1, deadline=deadline_3, amount=1),
+                Service(level=level_2, paper=paper_1, deadline=deadline_4, amount=1),
+            ]
         )
 
         valid_payload = {
@@ -2510,96 +2033,84 @@ class TestCreatePrices:
                 },
             ],
         }
-        response = fast_tenant_client.post(
-            reverse("service-create-bulk"),
-            data=json.dumps(valid_payload, cls=DjangoJSONEncoder),
-            content_type="application/json",
+        response = staff_client.post(
+            cached_reverse("service-create-bulk"), valid_payload, format="json"
         )
         assert response.status_code == status.HTTP_201_CREATED
         assert Service.objects.filter(paper__id=paper_1.id).count() == 3
-        assert (
-            Service.get(level=level_1, paper=paper_1, deadline=deadline_1).amount
-            == 10.56
-        )
-        assert (
-            Service.get(level=level_1, paper=paper_1, deadline=deadline_2).amount
-            == 9.15
-        )
-        assert (
-            Service.get(level=level_1, paper=paper_1, deadline=deadline_3).amount
-            == 8.00
-        )
+        assert Service.objects.get(
+            level=level_1, paper=paper_1, deadline=deadline_1
+        ).amount == Decimal("10.56")
+        assert Service.objects.get(
+            level=level_1, paper=paper_1, deadline=deadline_2
+        ).amount == Decimal("9.15")
+        assert Service.objects.get(
+            level=level_1, paper=paper_1, deadline=deadline_3
+        ).amount == Decimal("8.00")
+        assert not Service.objects.filter(
+            level=level_2, paper=paper_1, deadline=deadline_4
+        ).exists()
 
     def test_paper_id_required(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
+        staff_client,
         set_up,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """paper_id is required"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        level_1 = set_up["level_1"]
-        deadline_1 = set_up["deadline_1"]
-        deadline_2 = set_up["deadline_2"]
-        deadline_3 = set_up["deadline_3"]
-        response = fast_tenant_client.post(
-            reverse("service-create-bulk"),
-            data=json.dumps(
-                {
-                    "prices": [
-                        {
-                            "deadline_id": deadline_1.id,
-                            "level_id": level_1.id,
-                            "amount": 10.56,
-                        },
-                        {
-                            "deadline_id": deadline_2.id,
-                            "level_id": level_1.id,
-                            "amount": 9.15,
-                        },
-                        {
-                            "deadline_id": deadline_3.id,
-                            "level_id": level_1.id,
-                            "amount": 8.00,
-                        },
-                    ],
-                },
-                cls=DjangoJSONEncoder,
-            ),
-            content_type="application/json",
+        level_1 = set_up.level_1
+        deadline_1 = set_up.deadline_1
+        deadline_2 = set_up.deadline_2
+        deadline_3 = set_up.deadline_3
+        response = staff_client.post(
+            cached_reverse("service-create-bulk"),
+            {
+                "prices": [
+                    {
+                        "deadline_id": deadline_1.id,
+                        "level_id": level_1.id,
+                        "amount": 10.56,
+                    },
+                    {
+                        "deadline_id": deadline_2.id,
+                        "level_id": level_1.id,
+                        "amount": 9.15,
+                    },
+                    {
+                        "deadline_id": deadline_3.id,
+                        "level_id": level_1.id,
+                        "amount": 8.00,
+                    },
+                ],
+            },
+            format="json",
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-        response = fast_tenant_client.post(
-            reverse("service-create-bulk"),
-            data=json.dumps(
-                {
-                    "paper_id": "",
-                    "prices": [
-                        {
-                            "deadline_id": deadline_1.id,
-                            "level_id": level_1.id,
-                            "amount": 10.56,
-                        },
-                        {
-                            "deadline_id": deadline_2.id,
-                            "level_id": level_1.id,
-                            "amount": 9.15,
-                        },
-                        {
-                            "deadline_id": deadline_3.id,
-                            "level_id": level_1.id,
-                            "amount": 8.00,
-                        },
-                    ],
-                },
-                cls=DjangoJSONEncoder,
-            ),
-            content_type="application/json",
+        response = staff_client.post(
+            cached_reverse("service-create-bulk"),
+            {
+                "paper_id": "",
+                "prices": [
+                    {
+                        "deadline_id": deadline_1.id,
+                        "level_id": level_1.id,
+                        "amount": 10.56,
+                    },
+                    {
+                        "deadline_id": deadline_2.id,
+                        "level_id": level_1.id,
+                        "amount": 9.15,
+                    },
+                    {
+                        "deadline_id": deadline_3.id,
+                        "level_id": level_1.id,
+                        "amount": 8.00,
+                    },
+                ],
+            },
+            format="json",
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -2612,90 +2123,77 @@ class TestDeletePrices:
     def set_up(self):
         paper_1 = Paper.objects.create(name="Case Study")
         level_1 = Level.objects.create(name="High School")
-        deadline_1 = Deadline.objects.create(
-            value=1, deadline_type=Deadline.DeadlineType.DAY
-        )
-        deadline_2 = Deadline.objects.create(
-            value=2, deadline_type=Deadline.DeadlineType.DAY
-        )
-        deadline_3 = Deadline.objects.create(
-            value=3, deadline_type=Deadline.DeadlineType.DAY
-        )
-
-        Service.objects.create(
-            level=level_1, paper=paper_1, deadline=deadline_1, amount=1
-        )
-        Service.objects.create(
-            level=level_1, paper=paper_1, deadline=deadline_2, amount=1
+        deadlines = Deadline.objects.bulk_create(
+            [
+                Deadline(value=value, deadline_type=Deadline.DeadlineType.DAY)
+                for value in range(1, 4)
+            ]
         )
-        Service.objects.create(
-            level=level_1, paper=paper_1, deadline=deadline_3, amount=1
+        Service.objects.bulk_create(
+            [
+                Service(level=level_1, paper=paper_1, deadline=deadline, amount=1)
+                for deadline in deadlines
+            ]
         )
 
-        return locals()
+        return SimpleNamespace(paper_1=paper_1)
 
     def test_auth_required(
-        self, use_tenant_connection, fast_tenant_client, create_active_subscription
+        self, use_tenant_connection, fast_tenant_client, class_active_subscription
     ):
         """Authentication is required"""
-        response = fast_tenant_client.post(reverse("service-delete-bulk"), data={})
+        response = fast_tenant_client.post(
+            cached_reverse("service-delete-bulk"), data={}
+        )
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_only_staff(
         self,
         use_tenant_connection,
         fast_tenant_client,
-        customer,
-        create_active_subscription,
+        customer_token,
+        class_active_subscription,
     ):
         """Non-staff is not allowed to create prices"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(customer).access_token}
+        fast_tenant_client.cookies["access_token"] = customer_token
+        response = fast_tenant_client.post(
+            cached_reverse("service-delete-bulk"), data={}
         )
-        response = fast_tenant_client.post(reverse("service-delete-bulk"), data={})
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_staff(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
+        staff_client,
         set_up,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """Staff can delete prices"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        paper_1 = set_up["paper_1"]
+        paper_1 = set_up.paper_1
 
-        response = fast_tenant_client.post(
-            reverse("service-delete-bulk"),
+        response = staff_client.post(
+            cached_reverse("service-delete-bulk"),
             data={"paper_id": paper_1.id},
         )
         assert response.status_code == status.HTTP_200_OK
-        assert Service.objects.filter(paper__id=paper_1.id).count() == 0
+        assert not Service.objects.filter(paper__id=paper_1.id).exists()
 
     def test_paper_id_required(
         self,
         use_tenant_connection,
-        fast_tenant_client,
-        store_staff,
+        staff_client,
         set_up,
-        create_active_subscription,
+        class_active_subscription,
     ):
         """paper_id is required"""
-        fast_tenant_client.cookies = SimpleCookie(
-            {"access_token": RefreshToken.for_user(store_staff).access_token}
-        )
-        response = fast_tenant_client.post(
-            reverse("service-delete-bulk"),
+        response = staff_client.post(
+            cached_reverse("service-delete-bulk"),
             data={},
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-        response = fast_tenant_client.post(
-            reverse("service-delete-bulk"),
+        response = staff_client.post(
+            cached_reverse("service-delete-bulk"),
             data={"paper_id": ""},
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
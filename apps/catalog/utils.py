@@ -2,39 +2,65 @@
 
 from contextlib import suppress
 
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import connection
+from django.db.models import F, Q
+
 from apps.catalog.models import Service, WriterTypeService
 
+CACHE_TTL = getattr(settings, "CACHE_TTL", DEFAULT_TIMEOUT)
+# The columns of a service that are used to quote a price
+SERVICE_FIELDS = ("id", "level_id", "deadline_id", "paper_id", "amount")
+
+
+def get_services_cache_key(paper_id, deadline_id):
+    """Cache key of the services of a paper and deadline in the current tenant"""
+    return f"services:{connection.schema_name}:{paper_id}:{deadline_id}"
+
 
 def get_service(paper_id, deadline_id, level_id=None):
     """Get the service if available
 
     Priority is always given to the service where level is None
-    if it exists
+    if it exists. The services of a paper and deadline are cached
+    until one of them is saved or deleted
     """
-    service = None
+    cache_key = get_services_cache_key(paper_id, deadline_id)
+    services = cache.get(cache_key)
 
-    try:
-        service = Service.objects.get(
-            paper__id=paper_id, deadline__id=deadline_id, level=None
+    if services is None:
+        services = list(
+            Service.objects.filter(paper_id=paper_id, deadline_id=deadline_id)
+            .only(*SERVICE_FIELDS)
+            .order_by(F("level_id").asc(nulls_first=True))
         )
+        cache.set(cache_key, services, CACHE_TTL)
 
-    except Service.DoesNotExist:
-        with suppress(Service.DoesNotExist):
-            service = Service.objects.get(
-                paper__id=paper_id, deadline__id=deadline_id, level__id=level_id
-            )
-
-    return service
+    return next(
+        (
+            service
+            for service in services
+            if service.level_id is None or str(service.level_id) == str(level_id)
+        ),
+        None,
+    )
 
 
-def get_writer_type_service(paper_id, deadline_id, writer_type_id, level_id=None):
+def get_writer_type_service(
+    paper_id, deadline_id, writer_type_id, level_id=None, service=None
+):
     """Get writer type price
 
     Priority is always given to the service where level is None
-    if it exists"
+    if it exists. If the service has already been resolved by the
+    caller, pass it to skip looking it up again
     """
     writer_type_service = None
-    service = get_service(paper_id, deadline_id, level_id)
+
+    if service is None:
+        service = get_service(paper_id, deadline_id, level_id)
 
     if service:
         with suppress(WriterTypeService.DoesNotExist):
@@ -43,3 +69,46 @@ def get_writer_type_service(paper_id, deadline_id, writer_type_id, level_id=None
             )
 
     return writer_type_service
+
+
+def get_service_and_writer_type_service(
+    paper_id, deadline_id, writer_type_id, level_id=None
+):
+    """Get the service together with its writer type price
+
+    The service is the one `get_service` would pick, fetched in the same
+    query as its price. Returns `(None, None)` if that service does not
+    exist or is not priced for the writer type
+    """
+    writer_type_service = (
+        WriterTypeService.objects.select_related("service")
+        .only(
+            "id",
+            "amount",
+            "service",
+            *(f"service__{field}" for field in SERVICE_FIELDS),
+        )
+        .filter(
+            writer_type_id=writer_type_id,
+            service__paper_id=paper_id,
+            service__deadline_id=deadline_id,
+        )
+        .filter(Q(service__level__isnull=True) | Q(service__level_id=level_id))
+        .order_by(F("service__level_id").asc(nulls_first=True))
+        .first()
+    )
+
+    if not writer_type_service:
+        return None, None
+
+    # A service with no level still takes priority if it exists, even though
+    # it is not priced for the writer type
+    if (
+        writer_type_service.service.level_id
+        and Service.objects.filter(
+            paper_id=paper_id, deadline_id=deadline_id, level__isnull=True
+        ).exists()
+    ):
+        return None, None
+
+    return writer_type_service.service, writer_type_service
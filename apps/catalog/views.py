@@ -43,7 +43,7 @@ from .serializers import (
     WriterTypeServiceListSerializer,
     WriterTypeServiceSerializer,
 )
-from .utils import get_service, get_writer_type_service
+from .utils import get_service
 
 CACHE_TTL = getattr(settings, "CACHE_TTL", DEFAULT_TIMEOUT)
 
@@ -131,14 +131,12 @@ class DeadlineViewSet(
             data=request.data, context={"request": request}
         )
         serializer.is_valid(raise_exception=True)
-        value = serializer.data.get("value")
-        deadline_type = serializer.data.get("deadline_type")
-        response = {"exists": False}
+        exists = Deadline.objects.filter(
+            value=serializer.data.get("value"),
+            deadline_type=serializer.data.get("deadline_type"),
+        ).exists()
 
-        if (Deadline.objects.filter(value=value, deadline_type=deadline_type)).exists():
-            response.update({"exists": True})
-
-        return Response(response, status=status.HTTP_200_OK)
+        return Response({"exists": exists}, status=status.HTTP_200_OK)
 
 
 class PaperViewSet(
@@ -161,6 +159,17 @@ class PaperViewSet(
     pagination_class = None
     filterset_class = PaperFilter
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        # Listing only reads the serialized columns. Instances that may be
+        # saved are fully loaded so that auto fields such as updated_at are
+        # still written
+        if self.action in ("list", "uncached_list"):
+            queryset = queryset.only("id", "name", "sort_order")
+
+        return queryset
+
 
 class CalculatorAPIView(APIView):
     """Calculator view"""
@@ -177,11 +186,7 @@ class CalculatorAPIView(APIView):
             data=request.data, context={"request": request}
         )
         serializer.is_valid(raise_exception=True)
-        service = get_service(
-            serializer.data["paper"],
-            serializer.data["deadline"],
-            serializer.data.get("level"),
-        )
+        service = serializer.context["service"]
         subtotal = round(service.amount * serializer.data["pages"], 2)
         user = None
 
@@ -190,18 +195,10 @@ class CalculatorAPIView(APIView):
 
         # If writer_type was specified, add total writer price to
         # total price
-        if serializer.data.get("writer_type"):
-            writer_type_service = get_writer_type_service(
-                serializer.data["paper"],
-                serializer.data["deadline"],
-                serializer.data["writer_type"],
-                serializer.data.get("level"),
-            )
+        writer_type_service = serializer.context["writer_type_service"]
 
-            if writer_type_service:
-                subtotal += round(
-                    writer_type_service.amount * serializer.data["pages"], 2
-                )
+        if writer_type_service:
+            subtotal += round(writer_type_service.amount * serializer.data["pages"], 2)
 
         total = subtotal
         coupon_code = None
@@ -243,8 +240,10 @@ class WriterTypeServiceAPIView(APIView):
         if not service:
             return Response([], status=status.HTTP_200_OK)
 
-        qs = WriterTypeService.objects.filter(service=service).order_by(
-            "writer_type__sort_order"
+        qs = WriterTypeServiceListSerializer.prefetch_queryset(
+            WriterTypeService.objects.filter(service=service).order_by(
+                "writer_type__sort_order"
+            )
         )
 
         return Response(
@@ -260,6 +259,16 @@ class ServiceViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     filterset_class = ServiceFilter
     pagination_class = None
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        # Level, deadline and paper are serialized as primary keys, which are
+        # read from the foreign key columns without joining their tables
+        if self.action == "list":
+            queryset = queryset.only("level_id", "deadline_id", "paper_id", "amount")
+
+        return queryset
+
     def get_serializer_class(self):
         if self.action == "create_bulk":
             return CreatePricesSerializer
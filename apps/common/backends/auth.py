@@ -1,13 +1,58 @@
 """Custom authentication backends"""
 
+import hashlib
+import time
+from functools import lru_cache
+
+import jwt
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import BaseBackend, ModelBackend
+from django.core.cache import cache
 from django.db.models import Q
 from keycloak import KeycloakOpenID
 from keycloak.exceptions import KeycloakAuthenticationError, KeycloakInvalidTokenError
 
 User = get_user_model()
 
+# Seconds the Keycloak user of a token is cached for, at most
+KEYCLOAK_USER_CACHE_TTL = 60
+
+
+@lru_cache(maxsize=16)
+def get_keycloak_client(server_url, realm_name, client_id, client_secret_key):
+    """Return a shared Keycloak client for a realm
+
+    The client keeps a session to the Keycloak server, reusing it keeps
+    the connection alive across requests
+    """
+    return KeycloakOpenID(
+        server_url=server_url,
+        realm_name=realm_name,
+        client_id=client_id,
+        client_secret_key=client_secret_key,
+    )
+
+
+def get_keycloak_user_cache_key(server_url, realm_name, token):
+    """Cache key of the Keycloak user a token belongs to"""
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    return f"keycloak_user:{server_url}:{realm_name}:{token_hash}"
+
+
+def get_keycloak_user_cache_timeout(token):
+    """Seconds the user of a token may be cached for
+
+    The token is not verified here, Keycloak has already accepted it. Its
+    expiry only bounds the timeout so that the user is not cached for
+    longer than the token is valid
+    """
+    try:
+        expires_at = jwt.decode(token, options={"verify_signature": False})["exp"]
+    except (jwt.InvalidTokenError, KeyError, TypeError):
+        return 0
+
+    return max(min(KEYCLOAK_USER_CACHE_TTL, int(expires_at - time.time())), 0)
+
 
 class KeycloakBackend(BaseBackend):
     """Custom backend to authenticate user against a Keycloak server"""
@@ -22,30 +67,37 @@ class KeycloakBackend(BaseBackend):
         if not server_url or not realm_name or not client_id or not token:
             return None
 
-        keycloak = KeycloakOpenID(
-            server_url=server_url,
-            realm_name=realm_name,
-            client_id=client_id,
-            client_secret_key=client_secret_key,
-        )
-        user_info = None
+        cache_key = get_keycloak_user_cache_key(server_url, realm_name, token)
+        username = cache.get(cache_key)
 
-        try:
-            user_info = keycloak.userinfo(token)
-        except (KeycloakInvalidTokenError, KeycloakAuthenticationError):
-            return None
+        if username is None:
+            keycloak = get_keycloak_client(
+                server_url, realm_name, client_id, client_secret_key
+            )
 
-        if user_info.get("sub"):
             try:
-                user = User.objects.get(username=user_info["sub"])
+                user_info = keycloak.userinfo(token)
+            except (KeycloakInvalidTokenError, KeycloakAuthenticationError):
+                return None
 
-            except User.DoesNotExist:
-                # Create a new  user
-                user = User.objects.create(username=user_info["sub"])
+            username = user_info.get("sub")
 
-            return user
+            if not username:
+                return None
 
-        return None
+            timeout = get_keycloak_user_cache_timeout(token)
+
+            if timeout:
+                cache.set(cache_key, username, timeout)
+
+        try:
+            user = User.objects.get(username=username)
+
+        except User.DoesNotExist:
+            # Create a new  user
+            user = User.objects.create(username=username)
+
+        return user
 
     def get_user(self, user_id):
         try:
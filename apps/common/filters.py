@@ -0,0 +1,29 @@
+"""Custom query param filter backends"""
+
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class QueryParamFilterBackend(DjangoFilterBackend):
+    """Filter backend that only builds the filterset when it is needed
+
+    Binding and validating the filterset form has a cost on every request.
+    When none of the filterset's query params is present the filterset
+    would return the queryset unchanged, so it is skipped altogether
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = self.get_filterset_class(view, queryset)
+
+        if filterset_class is None:
+            return queryset
+
+        # Multi-value filters (e.g ranges) use suffixed query params such
+        # as `<name>_min`, so a prefix match is enough
+        if not any(
+            param == name or param.startswith(f"{name}_")
+            for param in request.query_params
+            for name in filterset_class.base_filters
+        ):
+            return queryset
+
+        return super().filter_queryset(request, queryset, view)
@@ -1,9 +1,35 @@
 """Send mail helper methods"""
 
 import logging
+from functools import lru_cache
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Seconds to wait for the mail server to accept the connection and to respond
+MAIL_SERVER_TIMEOUT = (3, 10)
+
+
+@lru_cache(maxsize=None)
+def get_mail_session():
+    """Return a shared session to the mail server
+
+    Connections are kept alive and reused across mails. Only failed
+    connections are retried, a POST that reached the server is not sent
+    again
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
 
 
 def send_mail(subject, message, recipient, sender_email, sender_name):
@@ -24,9 +50,10 @@ def send_mail(subject, message, recipient, sender_email, sender_name):
     }
 
     try:
-        response = requests.post(
+        response = get_mail_session().post(
             f"{settings.MAIL_SERVER_URL}mail/send/",
             json=data,
+            timeout=MAIL_SERVER_TIMEOUT,
         )
         response.raise_for_status()
 
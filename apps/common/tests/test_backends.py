@@ -0,0 +1,124 @@
+"""tests for apps.common.backends"""
+from unittest import mock
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from keycloak.exceptions import KeycloakAuthenticationError
+
+from apps.users.models import User
+
+from ..backends.auth import (
+    KeycloakBackend,
+    get_keycloak_client,
+    get_keycloak_user_cache_timeout,
+)
+
+NOW = 1700000000
+CREDENTIALS = {
+    "server_url": "https://keycloak.example.com/auth/",
+    "realm_name": "nero",
+    "client_id": "nero-client",
+    "client_secret_key": "secret",
+}
+PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def make_token(payload):
+    """Return a token with the payload, signed with RS256 like Keycloak's"""
+    return jwt.encode(payload, PRIVATE_KEY, algorithm="RS256")
+
+
+@pytest.fixture
+def freeze_time():
+    with mock.patch("apps.common.backends.auth.time.time", return_value=NOW):
+        yield
+
+
+@pytest.fixture
+def clear_keycloak_client():
+    """Clear the shared Keycloak clients"""
+    get_keycloak_client.cache_clear()
+    yield
+    get_keycloak_client.cache_clear()
+
+
+@mock.patch("apps.common.backends.auth.KeycloakOpenID")
+def test_keycloak_client_reused(mock_keycloak, clear_keycloak_client):
+    """A Keycloak client is created once per realm and reused"""
+    mock_keycloak.side_effect = lambda **kwargs: mock.Mock()
+    client = get_keycloak_client(*CREDENTIALS.values())
+    assert get_keycloak_client(*CREDENTIALS.values()) is client
+    mock_keycloak.assert_called_once_with(**CREDENTIALS)
+
+    other_realm = {**CREDENTIALS, "realm_name": "other"}
+    assert get_keycloak_client(*other_realm.values()) is not client
+    assert mock_keycloak.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "expires_in,timeout",
+    [(3600, 60), (60, 60), (30, 30), (0, 0), (-30, 0)],
+    ids=["capped", "ttl", "expiry", "expiring", "expired"],
+)
+def test_keycloak_user_cache_timeout(freeze_time, expires_in, timeout):
+    """The timeout is the cache TTL capped by the expiry of the token"""
+    token = make_token({"sub": "keycloak_user", "exp": NOW + expires_in})
+    assert get_keycloak_user_cache_timeout(token) == timeout
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["not-a-token", make_token({"sub": "keycloak_user"})],
+    ids=["malformed", "no_expiry"],
+)
+def test_keycloak_user_cache_timeout_invalid(token):
+    """Tokens whose expiry cannot be read are not cached"""
+    assert get_keycloak_user_cache_timeout(token) == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("use_tenant_connection", "use_locmem_cache_backend")
+@mock.patch("apps.common.backends.auth.get_keycloak_client")
+class TestKeycloakBackend:
+    """Tests for KeycloakBackend"""
+
+    def test_user_created(self, mock_client, freeze_time):
+        """The user of the token is created on the first login"""
+        mock_client.return_value.userinfo.return_value = {"sub": "keycloak_user"}
+        token = make_token({"sub": "keycloak_user", "exp": NOW + 3600})
+        user = KeycloakBackend().authenticate(None, token=token, **CREDENTIALS)
+        assert user == User.objects.get(username="keycloak_user")
+        mock_client.assert_called_once_with(*CREDENTIALS.values())
+
+    def test_cache_hit(self, mock_client, freeze_time):
+        """Keycloak is only asked for the user of a token once"""
+        mock_client.return_value.userinfo.return_value = {"sub": "keycloak_user"}
+        token = make_token({"sub": "keycloak_user", "exp": NOW + 3600})
+        user = KeycloakBackend().authenticate(None, token=token, **CREDENTIALS)
+        assert KeycloakBackend().authenticate(None, token=token, **CREDENTIALS) == user
+        mock_client.return_value.userinfo.assert_called_once_with(token)
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            make_token({"sub": "keycloak_user", "exp": NOW - 30}),
+            "not-a-token",
+        ],
+        ids=["expired", "malformed"],
+    )
+    def test_not_cached(self, mock_client, freeze_time, token):
+        """The user of a token whose expiry cannot bound the cache is not cached"""
+        mock_client.return_value.userinfo.return_value = {"sub": "keycloak_user"}
+        KeycloakBackend().authenticate(None, token=token, **CREDENTIALS)
+        KeycloakBackend().authenticate(None, token=token, **CREDENTIALS)
+        assert mock_client.return_value.userinfo.call_count == 2
+
+    def test_invalid_token(self, mock_client):
+        """No user is returned for a token Keycloak rejects"""
+        mock_client.return_value.userinfo.side_effect = KeycloakAuthenticationError(
+            "Invalid token"
+        )
+        user = KeycloakBackend().authenticate(None, token="token", **CREDENTIALS)
+        assert user is None
+        assert not User.objects.filter(username="keycloak_user").exists()
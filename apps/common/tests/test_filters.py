@@ -0,0 +1,60 @@
+"""tests for apps.common.filters"""
+from types import SimpleNamespace
+from unittest import mock
+
+import django_filters
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.catalog.models import Level
+
+from ..filters import QueryParamFilterBackend
+
+
+class LevelFilter(django_filters.FilterSet):
+    name = django_filters.CharFilter(lookup_expr="icontains")
+    sort_order = django_filters.RangeFilter()
+
+    class Meta:
+        model = Level
+        fields = ("name", "sort_order")
+
+
+VIEW = SimpleNamespace(filterset_class=LevelFilter)
+
+
+def filter_queryset(queryset, query_params):
+    request = Request(APIRequestFactory().get("/", query_params))
+    return QueryParamFilterBackend().filter_queryset(request, queryset, VIEW)
+
+
+@pytest.mark.parametrize("query_params", [{}, {"page": 2}])
+def test_no_filter_params(query_params):
+    """The queryset is returned untouched without building the filterset"""
+    queryset = Level.objects.all()
+
+    with mock.patch.object(QueryParamFilterBackend, "get_filterset") as mock_filterset:
+        assert filter_queryset(queryset, query_params) is queryset
+
+    mock_filterset.assert_not_called()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query_params,expected",
+    [
+        ({"name": "high"}, Level.objects.filter(name__icontains="high")),
+        ({"sort_order_min": 1}, Level.objects.filter(sort_order__gte=1)),
+        (
+            {"sort_order_min": 1, "sort_order_max": 3},
+            Level.objects.filter(sort_order__range=(1, 3)),
+        ),
+    ],
+    ids=["plain", "min", "range"],
+)
+def test_filter_params(query_params, expected):
+    """The queryset is filtered by plain and suffixed query params"""
+    assert str(filter_queryset(Level.objects.all(), query_params).query) == str(
+        expected.query
+    )
@@ -0,0 +1,60 @@
+"""tests for apps.common.mail"""
+from unittest import mock
+
+import pytest
+
+from ..mail import get_mail_session, send_mail
+
+
+@pytest.fixture
+def clear_mail_session():
+    """Clear the shared mail session"""
+    get_mail_session.cache_clear()
+    yield
+    get_mail_session.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "url", ["http://mail.example.com/", "https://mail.example.com/"]
+)
+def test_mail_session(clear_mail_session, url):
+    """The session is shared and retries failed connections"""
+    session = get_mail_session()
+    assert get_mail_session() is session
+
+    adapter = session.get_adapter(url)
+    assert adapter._pool_connections == 10  # pylint: disable=protected-access
+    assert adapter._pool_maxsize == 50  # pylint: disable=protected-access
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.backoff_factor == 0.2
+
+
+def test_send_mail(clear_mail_session, settings):
+    """The mail is sent through the shared session"""
+    settings.MAIL_SERVER_URL = "https://mail.example.com/"
+
+    with mock.patch.object(get_mail_session(), "post") as mock_post:
+        send_mail("Subject", "Message", "to@example.com", "from@example.com", "Sender")
+
+    mock_post.assert_called_once_with(
+        "https://mail.example.com/mail/send/",
+        json={
+            "recipient": "to@example.com",
+            "subject": "Subject",
+            "message": "Message",
+            "sender_email": "from@example.com",
+            "sender_name": "Sender",
+        },
+        timeout=(3, 10),
+    )
+    mock_post.return_value.raise_for_status.assert_called_once_with()
+
+
+def test_send_mail_no_server_url(clear_mail_session, settings):
+    """No mail is sent if the mail server is not set"""
+    settings.MAIL_SERVER_URL = None
+
+    with mock.patch.object(get_mail_session(), "post") as mock_post:
+        send_mail("Subject", "Message", "to@example.com", "from@example.com", "Sender")
+
+    mock_post.assert_not_called()
@@ -1,10 +1,18 @@
 """tests for apps.common.utils"""
+from unittest import mock
 
+import pytest
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 
 from apps.tenants.models import Domain, Tenant
 
-from ..utils import get_absolute_web_url
+from ..utils import (
+    PRESIGNED_URL_EXPIRY_MARGIN,
+    get_absolute_web_url,
+    get_cached_presigned_url,
+    get_s3_client,
+)
 
 
 class GetFrontendURLTesCase(TestCase):
@@ -31,3 +39,68 @@ class GetFrontendURLTesCase(TestCase):
         tenant = Tenant.objects.create(schema_name="nice", name="Nice")
         tenant.save()
         self.assertIsNone(get_absolute_web_url(tenant, "/verify/email"))
+
+
+@pytest.fixture
+def clear_s3_client():
+    """Clear the shared S3 client"""
+    get_s3_client.cache_clear()
+    yield
+    get_s3_client.cache_clear()
+
+
+@mock.patch("apps.common.utils.boto3.client")
+def test_s3_client_reused(mock_client, clear_s3_client):
+    """The S3 client is created once and reused"""
+    assert get_s3_client() is get_s3_client()
+    mock_client.assert_called_once()
+
+
+@mock.patch("apps.common.utils.create_presigned_url")
+def test_presigned_url_cache_hit(mock_create_signed_url, use_locmem_cache_backend):
+    """A cached presigned URL is returned without signing again"""
+    mock_create_signed_url.return_value = "https://s3.amazaon.com/signed-url/"
+
+    assert (
+        get_cached_presigned_url("bucket", "test.doc")
+        == "https://s3.amazaon.com/signed-url/"
+    )
+    assert (
+        get_cached_presigned_url("bucket", "test.doc")
+        == "https://s3.amazaon.com/signed-url/"
+    )
+    mock_create_signed_url.assert_called_once_with(
+        "bucket", "test.doc", 60 + PRESIGNED_URL_EXPIRY_MARGIN
+    )
+    assert (
+        cache.get("presigned_url:bucket:test.doc")
+        == "https://s3.amazaon.com/signed-url/"
+    )
+
+
+@mock.patch("apps.common.utils.create_presigned_url")
+def test_presigned_url_cache_timeout(mock_create_signed_url):
+    """A cached presigned URL is valid for longer than it is cached for"""
+    mock_create_signed_url.return_value = "https://s3.amazaon.com/signed-url/"
+
+    with mock.patch("apps.common.utils.cache") as mock_cache:
+        mock_cache.get.return_value = None
+        get_cached_presigned_url("bucket", "test.doc", expiration=120)
+
+    mock_create_signed_url.assert_called_once_with(
+        "bucket", "test.doc", 120 + PRESIGNED_URL_EXPIRY_MARGIN
+    )
+    mock_cache.set.assert_called_once_with(
+        "presigned_url:bucket:test.doc", "https://s3.amazaon.com/signed-url/", 120
+    )
+
+
+@mock.patch("apps.common.utils.create_presigned_url")
+def test_presigned_url_not_cached_on_error(
+    mock_create_signed_url, use_locmem_cache_backend
+):
+    """A failed signing is not cached"""
+    mock_create_signed_url.return_value = None
+
+    assert get_cached_presigned_url("bucket", "test.doc") is None
+    assert cache.get("presigned_url:bucket:test.doc") is None
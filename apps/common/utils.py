@@ -3,11 +3,13 @@
 import json
 import logging
 import urllib
+from functools import lru_cache
 
 import boto3
 import magic
 from botocore.exceptions import ClientError
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.template.defaultfilters import filesizeformat
 from django.urls import reverse
@@ -19,6 +21,9 @@ from apps.tenants.models import Tenant
 # pylint: disable=raise-missing-from
 # pylint: disable=too-many-arguments
 
+# seconds a cached presigned URL is still valid for once it is dropped
+PRESIGNED_URL_EXPIRY_MARGIN = 60
+
 
 @deconstructible
 class FileValidator:
@@ -100,6 +105,21 @@ def check_model_or_throw_validation_error(model, lookup_id, attribute_lookup_nam
     return lookup_id
 
 
+@lru_cache(maxsize=None)
+def get_s3_client():
+    """Return a shared S3 client
+
+    Building a client parses the credentials and endpoint configuration,
+    boto3 clients are thread safe so one is reused across requests
+    """
+    return boto3.client(
+        "s3",
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_S3_REGION_NAME,
+    )
+
+
 def create_presigned_url(bucket_name, object_name, expiration=60):
     """Generate a presigned URL to share an S3 object
 
@@ -110,12 +130,7 @@ def create_presigned_url(bucket_name, object_name, expiration=60):
     """
 
     # Generate a presigned URL for the S3 object
-    s3_client = boto3.client(
-        "s3",
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
-    )
+    s3_client = get_s3_client()
     try:
         response = s3_client.generate_presigned_url(
             "get_object",
@@ -130,6 +145,29 @@ def create_presigned_url(bucket_name, object_name, expiration=60):
     return response
 
 
+def get_cached_presigned_url(bucket_name, object_name, expiration=60):
+    """Return a presigned URL, reusing one signed earlier if still valid
+
+    The URL is signed for `PRESIGNED_URL_EXPIRY_MARGIN` seconds longer than
+    it is cached for, so a cached URL always has at least that long left
+    to be used by the client
+    """
+    cache_key = f"presigned_url:{bucket_name}:{object_name}"
+    url = cache.get(cache_key)
+
+    if url:
+        return url
+
+    url = create_presigned_url(
+        bucket_name, object_name, expiration + PRESIGNED_URL_EXPIRY_MARGIN
+    )
+
+    if url:
+        cache.set(cache_key, url, expiration)
+
+    return url
+
+
 def reverse_querystring(
     view, urlconf=None, args=None, kwargs=None, current_app=None, query_kwargs=None
 ):
@@ -1,20 +1,51 @@
 """Global test fixture"""
-import dateutil
+from contextlib import contextmanager
+from datetime import datetime
+
 import pytest
 import requests
+from django.apps import apps as django_apps
+from django.conf import settings as django_settings
+from django.core.cache import cache
+from django.core.management.color import no_style
 from django.db import connection, transaction
 from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.utils import timezone
 from django_tenants.test.cases import FastTenantTestCase
 from django_tenants.test.client import TenantClient
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
 
 from apps.subscription.models import Paypal, Subscription
 from apps.tenants.models import Tenant
 from apps.users.models import User
 
+SUBSCRIPTION_START_TIME = datetime(2016, 1, 1, 0, 20, 49, tzinfo=timezone.utc)
+SUBSCRIPTION_NEXT_BILLING_TIME = datetime(2016, 5, 1, 0, 20, 49, tzinfo=timezone.utc)
 
-@pytest.fixture(autouse=True)
+
+def pytest_configure(config):
+    """Configure settings for the test session
+
+    django-tenants sets the search path on every cursor by default. Limit it
+    to when the schema changes, every tenant request sets the schema anyway.
+
+    Passwords and verification codes are hashed with MD5, the default hasher
+    is deliberately slow and the tests do not depend on its strength
+    """
+    django_settings.TENANT_LIMIT_SET_CALLS = True
+    django_settings.PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ]
+
+
+@pytest.fixture(scope="session", autouse=True)
 def mute_signals(request):
-    """Mute Django signals"""
+    """Mute Django signals
+
+    Session scoped so that signals are also muted for data created by class
+    scoped fixtures, which are set up before any function scoped fixture
+    """
     post_save.receivers = []
     pre_save.receivers = []
     pre_delete.receivers = []
@@ -33,6 +64,9 @@ def disable_network_calls(monkeypatch):
 
     monkeypatch.setattr(requests, "get", lambda *args, **kwargs: stunted_get())
     monkeypatch.setattr(requests, "post", lambda *args, **kwargs: stunted_get())
+    monkeypatch.setattr(
+        requests.Session, "request", lambda *args, **kwargs: stunted_get()
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -45,57 +79,160 @@ def use_dummy_cache_backend(settings):
     }
 
 
+@pytest.fixture()
+def use_locmem_cache_backend(settings, use_dummy_cache_backend):
+    """Local memory caching for tests that depend on cached values"""
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture(scope="session")
 def use_fast_tenant(django_db_setup, django_db_blocker):
-    """Set up fast tenant"""
+    """Set up fast tenant and return it
+
+    pytest-django gives each xdist worker its own test database, so every
+    worker sets up the tenant once and reuses it for the whole session
+    """
     with django_db_blocker.unblock(), transaction.atomic():
-        if not Tenant.objects.filter(
+        tenant = Tenant.objects.filter(
             schema_name=FastTenantTestCase.get_test_schema_name()
-        ).exists():
+        ).first()
+
+        if tenant is None:
             tenant = Tenant(schema_name=FastTenantTestCase.get_test_schema_name())
             tenant.save()
             tenant.domains.create(domain=FastTenantTestCase.get_test_tenant_domain())
 
+    return tenant
+
 
 @pytest.fixture
-def fast_tenant_client():
+def fast_tenant_client(use_fast_tenant):
     """Client that uses fast tenant"""
-    tenant = Tenant.objects.get(schema_name=FastTenantTestCase.get_test_schema_name())
-    return TenantClient(tenant)
+    return TenantClient(use_fast_tenant)
+
+
+@pytest.fixture
+def fast_tenant_api_client():
+    """REST framework client that uses fast tenant
+
+    Requests are encoded by the REST framework renderers, pass `format="json"`
+    instead of a JSON string and content type
+    """
+    return APIClient(HTTP_HOST=FastTenantTestCase.get_test_tenant_domain())
 
 
 @pytest.fixture
 def use_tenant_connection(use_fast_tenant):
     """Set the database connection to use the tenant schema"""
-    tenant = Tenant.objects.get(schema_name=FastTenantTestCase.get_test_schema_name())
-    connection.set_tenant(tenant)
+    connection.set_tenant(use_fast_tenant)
 
     yield
 
     connection.set_schema_to_public()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def use_clean_fast_tenant(use_fast_tenant, django_db_blocker):
+    """Fast tenant without the rows an earlier run may have left behind
+
+    Class scoped data is committed. A run stopped before a class finished
+    leaves its rows in the reused test database, so the tables of the
+    project's tenant apps are emptied once per session
+    """
+    tables = [
+        model._meta.db_table
+        for app_config in django_apps.get_app_configs()
+        if app_config.name.startswith("apps.")
+        and app_config.name in django_settings.TENANT_APPS
+        for model in app_config.get_models(include_auto_created=True)
+    ]
+
+    with django_db_blocker.unblock():
+        connection.set_tenant(use_fast_tenant)
+
+        try:
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sql_flush(
+                    no_style(), tables, allow_cascade=True
+                ):
+                    cursor.execute(sql)
+        finally:
+            connection.set_schema_to_public()
+
+    return use_fast_tenant
+
+
+@pytest.fixture(scope="class")
+def class_tenant_db(use_clean_fast_tenant, django_db_blocker):
+    """Tenant schema access for class scoped fixtures
+
+    Yields a context manager that unblocks the database and sets the tenant
+    schema. Rows created within it are committed so that every test in the
+    class can read them, each test still rolls back its own changes. Append
+    the created objects to the list returned by the context manager, they are
+    deleted in reverse order once all the tests in the class have run.
+    """
+    created = []
+
+    @contextmanager
+    def tenant_db():
+        with django_db_blocker.unblock():
+            connection.set_tenant(use_clean_fast_tenant)
+
+            try:
+                yield created
+            finally:
+                connection.set_schema_to_public()
+
+    yield tenant_db
+
+    with tenant_db():
+        for obj in reversed(created):
+            obj.delete()
+
+
+@pytest.fixture(scope="session")
 def test_password():
     return "strong-test-pass"
 
 
-@pytest.fixture
-def create_active_subscription():
+def make_active_subscription():
+    """Create an active Paypal subscription, returns the created objects"""
     subscription = Subscription.objects.create(
         is_on_trial=False,
         status=Subscription.Status.ACTIVE,
-        start_time=dateutil.parser.parse(
-            "2016-01-01T00:20:49Z",
-        ),
-        next_billing_time=dateutil.parser.parse(
-            "2016-05-01T00:20:49Z",
-        ),
+        start_time=SUBSCRIPTION_START_TIME,
+        next_billing_time=SUBSCRIPTION_NEXT_BILLING_TIME,
     )
-    Paypal.objects.create(
+    paypal = Paypal.objects.create(
         subscription=subscription, paypal_subscription_id="payal_subscription_id"
     )
 
+    return [subscription, paypal]
+
+
+@pytest.fixture
+def create_active_subscription():
+    make_active_subscription()
+
+
+@pytest.fixture(scope="class")
+def class_active_subscription(class_tenant_db):
+    """Active subscription shared by all the tests in a class
+
+    Only use it in classes where none of the tests expect the subscription
+    to be missing
+    """
+    with class_tenant_db() as created:
+        created += make_active_subscription()
+
 
 @pytest.fixture
 def store_owner(test_password):
@@ -131,6 +268,40 @@ def customer(test_password):
     )
 
 
+@pytest.fixture
+def staff_token(store_staff):
+    """Access token for store staff"""
+    return str(AccessToken.for_user(store_staff))
+
+
+@pytest.fixture
+def customer_token(customer):
+    """Access token for customer"""
+    return str(AccessToken.for_user(customer))
+
+
+@pytest.fixture
+def staff_client(fast_tenant_api_client, store_staff):
+    """Fast tenant client authenticated as store staff
+
+    Authentication is forced, use a token for tests of the authentication
+    itself
+    """
+    fast_tenant_api_client.force_authenticate(user=store_staff)
+    return fast_tenant_api_client
+
+
+@pytest.fixture
+def customer_client(fast_tenant_api_client, customer):
+    """Fast tenant client authenticated as customer
+
+    Authentication is forced, use a token for tests of the authentication
+    itself
+    """
+    fast_tenant_api_client.force_authenticate(user=customer)
+    return fast_tenant_api_client
+
+
 @pytest.fixture
 def dummy_uuid():
     return "4a2aaa24-7a41-4d51-9e75-21a2e1ebb164"
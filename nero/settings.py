@@ -236,7 +236,7 @@ REST_FRAMEWORK = {
         "apps.common.authentication.KeycloakTokenAuthentication",
     ),
     "DEFAULT_FILTER_BACKENDS": (
-        "django_filters.rest_framework.DjangoFilterBackend",
+        "apps.common.filters.QueryParamFilterBackend",
         "rest_framework.filters.OrderingFilter",
     ),
     "DEFAULT_PAGINATION_CLASS": "apps.common.pagination.CustomPagination",